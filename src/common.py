@@ -5,34 +5,41 @@ This module provides shared color definitions, constants, utility functions,
 and common patterns used across multiple modules in the fix-owner script.
 """
 
+import functools
+import importlib.util
 import os
+import stat
 import sys
 import time
 from typing import Optional
 
-# Import colorama for terminal color support
-try:
-    from colorama import init, Fore, Style
-    init(autoreset=True)  # Automatically reset color constants after each print
-    COLORAMA_AVAILABLE = True
-except ImportError:
-    # Fallback if colorama is not available
-    COLORAMA_AVAILABLE = False
-    class _MockColor:
-        def __getattr__(self, name): return ""
-    Fore = Back = Style = _MockColor()
-
-# Common color constants
-if COLORAMA_AVAILABLE:
-    info_lt_clr = Fore.WHITE + Style.BRIGHT      # info_lt_clr: bright white for light info (values)
-    info_dk_clr = Fore.LIGHTBLACK_EX             # info_dk_clr: light gray for dark info (descriptions)
-    section_clr = Fore.LIGHTCYAN_EX              # section_clr: light cyan for section headers
-    error_clr = Fore.RED + Style.BRIGHT          # error_clr: red for errors
-    warn_clr = Fore.YELLOW + Style.BRIGHT        # warn_clr: yellow for warnings
-    ok_clr = Fore.GREEN                          # ok_clr: green for success/valid status
-    reset_clr = Style.RESET_ALL                  # reset_clr: reset color formatting
+# Terminal color support
+# colorama is only needed to enable ANSI escape processing on Windows consoles, so it
+# is located here but imported lazily by enable_console_colors() on first colored output.
+# Colors are only used when stdout is a terminal (redirected output stays plain text)
+# and the NO_COLOR environment variable is unset or empty (https://no-color.org).
+COLORAMA_AVAILABLE = importlib.util.find_spec("colorama") is not None
+COLORS_ENABLED = (COLORAMA_AVAILABLE and not os.environ.get("NO_COLOR")
+                  and sys.stdout is not None and sys.stdout.isatty())
+_console_colors_ready = False
+
+
+class _MockColor:
+    """Fallback color namespace that returns an empty string for every color."""
+    def __getattr__(self, name): return ""
+
+
+# Common color constants (precomputed ANSI escape sequences)
+if COLORS_ENABLED:
+    info_lt_clr = "\x1b[37m\x1b[1m"              # info_lt_clr: bright white for light info (values)
+    info_dk_clr = "\x1b[90m"                     # info_dk_clr: light gray for dark info (descriptions)
+    section_clr = "\x1b[96m"                     # section_clr: light cyan for section headers
+    error_clr = "\x1b[31m\x1b[1m"                # error_clr: red for errors
+    warn_clr = "\x1b[33m\x1b[1m"                 # warn_clr: yellow for warnings
+    ok_clr = "\x1b[32m"                          # ok_clr: green for success/valid status
+    reset_clr = "\x1b[0m"                        # reset_clr: reset color formatting
 else:
-    # Empty strings when colorama is not available
+    # Empty strings when colorama is not available or output is redirected
     info_lt_clr = ""
     info_dk_clr = ""
     section_clr = ""
@@ -47,6 +54,12 @@ REQUIRED_PYTHON_VERSION = (3, 13)
 DEFAULT_TIMEOUT_SECONDS = 0  # No timeout by default
 MAX_PATH_LENGTH = 260  # Windows MAX_PATH limitation
 CHUNK_SIZE = 1000  # Process items in chunks for memory efficiency
+TIMEOUT_CHECK_INTERVAL = 1024  # Files processed between timeout checks within a directory
+OUTPUT_BUFFER_LINES = 1024  # Buffered verbose lines written per batch within a directory
+SID_CACHE_SIZE = 4096  # Maximum number of cached SID-to-account lookups
+
+# Directory containing this module (added to sys.path by setup_module_path)
+_MODULE_DIR = os.path.dirname(os.path.abspath(__file__))
 
 # Exit codes
 EXIT_SUCCESS = 0
@@ -58,24 +71,26 @@ SECTION_BAR_WIDTH = 50
 REPORT_BAR_WIDTH = 110
 
 # Windows security availability flags
+# WIN32SECURITY_AVAILABLE is the weaker condition (win32security alone, enough for SID
+# name lookups); PYWIN32_AVAILABLE also requires win32api and win32con
+WIN32SECURITY_AVAILABLE = False
+PYWIN32_AVAILABLE = False
 try:
     import win32security
+    WIN32SECURITY_AVAILABLE = True
     import win32api
     import win32con
     PYWIN32_AVAILABLE = True
 except ImportError:
-    PYWIN32_AVAILABLE = False
-
-try:
-    import win32security
-    WIN32SECURITY_AVAILABLE = True
-except ImportError:
-    WIN32SECURITY_AVAILABLE = False
+    pass
 
 
 def get_current_timestamp() -> float:
     """
-    Get current timestamp with high precision.
+    Get current wall-clock timestamp.
+    
+    Use this for timestamps shown to the user or embedded in filenames. For
+    measuring durations use get_current_timestamp_ns(), which is monotonic.
     
     Returns:
         Current time as float timestamp
@@ -83,12 +98,30 @@ def get_current_timestamp() -> float:
     return time.time()
 
 
+def get_current_timestamp_ns() -> int:
+    """
+    Get a monotonic high-resolution timestamp for measuring elapsed time.
+    
+    Unlike time.time(), this is unaffected by system clock adjustments and has
+    sub-microsecond resolution on Windows (time.time() ticks every ~15.6 ms).
+    The value is only meaningful relative to another call.
+    
+    Returns:
+        Performance counter value in nanoseconds
+    """
+    return time.perf_counter_ns()
+
+
 def format_elapsed_time(start_time: float) -> float:
     """
     Calculate elapsed time from a start timestamp.
     
+    start_time is a wall-clock value from get_current_timestamp(), so the result
+    follows system clock adjustments. For durations prefer the monotonic pair
+    get_current_timestamp_ns() / format_elapsed_time_ns().
+    
     Args:
-        start_time: Starting timestamp
+        start_time: Starting timestamp from get_current_timestamp()
         
     Returns:
         Elapsed time in seconds as float
@@ -96,6 +129,19 @@ def format_elapsed_time(start_time: float) -> float:
     return time.time() - start_time
 
 
+def format_elapsed_time_ns(start_ns: int) -> float:
+    """
+    Calculate elapsed time from a get_current_timestamp_ns() start value.
+    
+    Args:
+        start_ns: Starting performance counter value in nanoseconds
+        
+    Returns:
+        Elapsed time in seconds as float
+    """
+    return (time.perf_counter_ns() - start_ns) / 1e9
+
+
 def format_timestamp_for_filename(timestamp: float = None) -> str:
     """
     Format a timestamp for use in filenames.
@@ -134,8 +180,8 @@ def ensure_output_directory() -> str:
         Path to the output directory
     """
     output_dir = "output"
-    if not os.path.exists(output_dir):
-        os.makedirs(output_dir)
+    # EAFP: a single makedirs call is race-free if another process creates it first
+    os.makedirs(output_dir, exist_ok=True)
     return output_dir
 
 
@@ -160,9 +206,32 @@ def setup_module_path() -> None:
     This function adds the current directory to sys.path to enable
     absolute imports when running as a script.
     """
-    current_dir = os.path.dirname(os.path.abspath(__file__))
-    if current_dir not in sys.path:
-        sys.path.insert(0, current_dir)
+    if _MODULE_DIR not in sys.path:
+        sys.path.insert(0, _MODULE_DIR)
+
+
+def enable_console_colors() -> None:
+    """
+    Enable ANSI escape processing on the console before the first colored output.
+    
+    colorama is imported only here, and only when colors are enabled. On Windows 10
+    and later just_fix_windows_console() turns on native VT processing without
+    wrapping sys.stdout; on older consoles it falls back to colorama's converter.
+    Safe to call repeatedly.
+    """
+    global _console_colors_ready
+    if _console_colors_ready or not COLORS_ENABLED:
+        return
+    _console_colors_ready = True
+    
+    import colorama
+    colorama.just_fix_windows_console()
+
+
+@functools.lru_cache(maxsize=16)
+def _section_bar(width: int) -> str:
+    """Return the colored separator bar for a width (built once per width)."""
+    return f"{section_clr}{'=' * width}{reset_clr}"
 
 
 def print_section_header(title: str, width: int = SECTION_BAR_WIDTH) -> None:
@@ -173,9 +242,11 @@ def print_section_header(title: str, width: int = SECTION_BAR_WIDTH) -> None:
         title: Section title to display
         width: Width of the header bars (default: 50)
     """
-    print(f"\n{section_clr}{'=' * width}{reset_clr}")
+    enable_console_colors()
+    bar = _section_bar(width)
+    print(f"\n{bar}")
     print(f"{section_clr}{title}{reset_clr}")
-    print(f"{section_clr}{'=' * width}{reset_clr}")
+    print(bar)
 
 
 def print_section_bar(width: int = SECTION_BAR_WIDTH) -> None:
@@ -185,7 +256,8 @@ def print_section_bar(width: int = SECTION_BAR_WIDTH) -> None:
     Args:
         width: Width of the bar (default: 50)
     """
-    print(f"{section_clr}{'=' * width}{reset_clr}")
+    enable_console_colors()
+    print(_section_bar(width))
 
 
 def safe_exit(exit_code: int, message: Optional[str] = None) -> None:
@@ -197,6 +269,7 @@ def safe_exit(exit_code: int, message: Optional[str] = None) -> None:
         message: Optional message to print before exiting
     """
     if message:
+        enable_console_colors()
         if exit_code == EXIT_ERROR:
             print(f"{error_clr}{message}{reset_clr}", file=sys.stderr)
         elif exit_code == EXIT_INTERRUPTED:
@@ -211,6 +284,9 @@ def validate_path_exists(path: str) -> bool:
     """
     Validate that a path exists.
     
+    Results are not cached, since a path can appear or disappear while the
+    script runs.
+    
     Args:
         path: Path to validate
         
@@ -233,10 +309,71 @@ def validate_path_is_directory(path: str) -> bool:
     return os.path.isdir(path)
 
 
+def classify_path(path: str) -> str:
+    """
+    Classify a path with a single stat call.
+    
+    Use this instead of validate_path_exists() followed by
+    validate_path_is_directory(), which stat the same path twice.
+    
+    Args:
+        path: Path to classify
+        
+    Returns:
+        'missing', 'dir', 'file' or 'other'
+    """
+    try:
+        mode = os.stat(path).st_mode
+    except (OSError, ValueError):
+        return 'missing'
+    if stat.S_ISDIR(mode):
+        return 'dir'
+    return 'file' if stat.S_ISREG(mode) else 'other'
+
+
+def extended_length_path(path: str) -> str:
+    """
+    Add the Windows extended-length prefix to an absolute path.
+    
+    Windows passes \\\\?\\ paths to the file system without parsing them, so they
+    are not limited to MAX_PATH_LENGTH characters. FileSystemWalker applies it
+    once, to the walk's root, and only for the OS and security calls; output
+    and logs keep the path as it was given.
+    
+    Args:
+        path: Absolute Windows path (drive letter or UNC)
+        
+    Returns:
+        The path with the extended-length prefix, or the path unchanged if it
+        already starts with a device prefix
+    """
+    if path.startswith(('\\\\?\\', '\\\\.\\')):
+        return path
+    if path.startswith('\\\\'):
+        # UNC paths take the \\?\UNC\ form: \\server\share -> \\?\UNC\server\share
+        return '\\\\?\\UNC\\' + path[2:]
+    return '\\\\?\\' + path
+
+
+@functools.lru_cache(maxsize=None)
+def _resolve_imports(relative_module: str, absolute_module: str, items: tuple) -> tuple:
+    """Import a module (relative to this package first) and return the requested attributes."""
+    try:
+        # Try relative import first (only possible when loaded as part of a package)
+        module = importlib.import_module(relative_module, package=__package__ or None)
+    except (ImportError, TypeError):
+        # Fall back to absolute import (TypeError: no package when run as a script)
+        module = importlib.import_module(absolute_module)
+    return tuple(getattr(module, item) for item in items)
+
+
 def try_import_with_fallback(relative_module: str, absolute_module: str, items: list):
     """
     Try importing with relative imports first, then fall back to absolute imports.
     
+    Results are memoized, so repeated requests for the same items do not pay
+    for the failing relative import again when running as a script.
+    
     Args:
         relative_module: Relative module name (e.g., '.common')
         absolute_module: Absolute module name (e.g., 'common')
@@ -245,11 +382,5 @@ def try_import_with_fallback(relative_module: str, absolute_module: str, items:
     Returns:
         Dictionary of imported items
     """
-    try:
-        # Try relative import first
-        module = __import__(relative_module, fromlist=items, level=1)
-        return {item: getattr(module, item) for item in items}
-    except ImportError:
-        # Fall back to absolute import
-        module = __import__(absolute_module, fromlist=items)
-        return {item: getattr(module, item) for item in items}
\ No newline at end of file
+    items = tuple(items)
+    return dict(zip(items, _resolve_imports(relative_module, absolute_module, items)))
\ No newline at end of file
@@ -21,27 +21,97 @@ Classes:
     ExceptionContext: Context manager for operation-specific error handling
 """
 
+import re
 import sys
 import traceback
-from enum import Enum
-from typing import Optional, Dict, Any, Callable
+from enum import IntEnum
+from typing import Optional, Any
 from dataclasses import dataclass
 import ctypes
 
 
-class ErrorCategory(Enum):
-    """Categories of errors that can occur during script execution."""
-    SECURITY = "security"           # Windows security API errors
-    FILESYSTEM = "filesystem"       # File system access errors
-    CONFIGURATION = "configuration" # Configuration and validation errors
-    TIMEOUT = "timeout"            # Timeout-related errors
-    PRIVILEGE = "privilege"        # Administrator privilege errors
-    CRITICAL = "critical"          # Critical errors that should terminate execution
+class ErrorCategory(IntEnum):
+    """
+    Categories of errors that can occur during script execution.
+    
+    An IntEnum so that set membership and comparisons use int's C-level hash and
+    equality instead of Enum's Python-level __hash__. Use label for display.
+    Values start at 1 so that every category is truthy.
+    """
+    SECURITY = 1        # Windows security API errors
+    FILESYSTEM = 2      # File system access errors
+    CONFIGURATION = 3   # Configuration and validation errors
+    TIMEOUT = 4         # Timeout-related errors
+    PRIVILEGE = 5       # Administrator privilege errors
+    CRITICAL = 6        # Critical errors that should terminate execution
+    
+    @property
+    def label(self) -> str:
+        """Lowercase category name used in logs (e.g. 'security')."""
+        return self.name.lower()
+
+
+# Categories whose errors should terminate execution
+_TERMINATING_CATEGORIES = frozenset({ErrorCategory.CRITICAL, ErrorCategory.PRIVILEGE})
+
+
+# Suggested solutions per error category (see ErrorManager.get_common_error_solutions)
+_COMMON_SOLUTIONS = {
+    ErrorCategory.SECURITY: (
+        "Ensure the script is running with Administrator privileges",
+        "Check that the target account exists and is valid",
+        "Verify that the path is accessible and not locked by another process"
+    ),
+    ErrorCategory.FILESYSTEM: (
+        "Verify that the path exists and is accessible",
+        "Check that files are not in use by other applications",
+        "Ensure sufficient disk space is available",
+        "Check network connectivity if accessing network paths"
+    ),
+    ErrorCategory.CONFIGURATION: (
+        "Verify command-line arguments are correct",
+        "Check that the target owner account name is valid",
+        "Ensure the root path exists and is a directory"
+    ),
+    ErrorCategory.PRIVILEGE: (
+        "Run the script as Administrator",
+        "Right-click Command Prompt and select 'Run as administrator'",
+        "Ensure your account has the necessary privileges"
+    ),
+    ErrorCategory.TIMEOUT: (
+        "Increase the timeout value using -to option",
+        "Process smaller directory structures",
+        "Check system performance and available resources"
+    )
+}
+_DEFAULT_SOLUTIONS = ("Contact system administrator for assistance",)
+
+
+# Message keywords used by ErrorManager._categorize_exception, compiled once so each
+# category costs a single case-insensitive regex scan (no lowercased copy of the message)
+_SECURITY_KEYWORDS = re.compile(
+    r'access denied|permission denied|privilege|security|sid|owner|acl|security descriptor', re.IGNORECASE
+)
+_FILESYSTEM_KEYWORDS = re.compile(
+    r'file not found|path not found|directory not found|file in use|sharing violation|network|drive', re.IGNORECASE
+)
+_CONFIGURATION_KEYWORDS = re.compile(
+    r'invalid argument|invalid account|account not found|invalid path|invalid option', re.IGNORECASE
+)
+_TIMEOUT_KEYWORDS = re.compile(r'timeout', re.IGNORECASE)
+_FILESYSTEM_TYPES = frozenset({'FileNotFoundError', 'PermissionError', 'OSError'})
+_CONFIGURATION_TYPES = frozenset({'ValueError', 'TypeError'})
+_CRITICAL_TYPES = (SystemExit, KeyboardInterrupt, MemoryError)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True, eq=False)
 class ErrorInfo:
-    """Information about an error that occurred."""
+    """
+    Information about an error that occurred.
+    
+    One is created per handled exception, so instances use slots instead of a
+    per-instance __dict__. They are never modified after creation.
+    """
     category: ErrorCategory
     path: Optional[str]
     message: str
@@ -74,14 +144,9 @@ class ErrorManager:
         self.stats_tracker = stats_tracker
         self.output_manager = output_manager
         self.start_timestamp_str = start_timestamp_str or "unknown_time"
-        self.error_handlers: Dict[ErrorCategory, Callable] = {
-            ErrorCategory.SECURITY: self._handle_security_error,
-            ErrorCategory.FILESYSTEM: self._handle_filesystem_error,
-            ErrorCategory.CONFIGURATION: self._handle_configuration_error,
-            ErrorCategory.TIMEOUT: self._handle_timeout_error,
-            ErrorCategory.PRIVILEGE: self._handle_privilege_error,
-            ErrorCategory.CRITICAL: self._handle_critical_error
-        }
+        
+        # Result of IsUserAnAdmin (None = not checked yet); privileges don't change during a run
+        self._is_admin = None
     
     def handle_exception(self, exception: Exception, path: Optional[str] = None, 
                         context: str = "", critical: bool = False) -> ErrorInfo:
@@ -97,30 +162,70 @@ class ErrorManager:
         Returns:
             ErrorInfo object with details about the handled error
         """
+        # Convert the exception to text once for both categorization and the message
+        exception_message = str(exception)
+        
         # Categorize the error
-        category = self._categorize_exception(exception, path, context)
+        category = self._categorize_exception(exception, path, context, exception_message)
         
         # Create error info
         error_info = ErrorInfo(
             category=category,
             path=path,
-            message=self._format_error_message(exception, path, context),
+            message=self._format_error_message(exception, path, context, exception_message),
             original_exception=exception,
-            is_critical=critical or category == ErrorCategory.CRITICAL,
-            should_terminate=critical or category in [ErrorCategory.CRITICAL, ErrorCategory.PRIVILEGE]
+            is_critical=critical or category is ErrorCategory.CRITICAL,
+            should_terminate=critical or category in _TERMINATING_CATEGORIES
         )
         
         # Handle the error based on category
-        handler = self.error_handlers.get(category, self._handle_generic_error)
-        handler(error_info)
+        # Value patterns compare with int equality, avoiding a dict lookup per exception
+        match category:
+            case ErrorCategory.SECURITY:
+                self._handle_security_error(error_info)
+            case ErrorCategory.FILESYSTEM:
+                self._handle_filesystem_error(error_info)
+            case ErrorCategory.CONFIGURATION:
+                self._handle_configuration_error(error_info)
+            case ErrorCategory.TIMEOUT:
+                self._handle_timeout_error(error_info)
+            case ErrorCategory.PRIVILEGE:
+                self._handle_privilege_error(error_info)
+            case ErrorCategory.CRITICAL:
+                self._handle_critical_error(error_info)
+            case _:
+                self._handle_generic_error(error_info)
         
         # Count the exception if stats tracker is available
         if self.stats_tracker:
             self.stats_tracker.increment_exceptions()
         
+        # MEMORY: Drop the traceback of handled, non-terminating exceptions
+        # The message is already formatted, and the traceback's frames (with their locals)
+        # would otherwise stay alive for as long as anything references the exception.
+        # Terminating errors keep it for re-raising; verbose runs keep it for debugging.
+        if not error_info.should_terminate and not self._keep_tracebacks():
+            exception.__traceback__ = None
+        
         return error_info
     
-    def _categorize_exception(self, exception: Exception, path: Optional[str], context: str) -> ErrorCategory:
+    def _keep_tracebacks(self) -> bool:
+        """
+        Check whether handled exceptions should keep their tracebacks (verbose mode).
+        
+        Returns:
+            True if the output manager is in verbose mode or its level is unknown
+        """
+        if not self.output_manager:
+            return False
+        try:
+            return self.output_manager.get_verbose_level() > 0
+        except (TypeError, AttributeError):
+            # Handle mock objects or other issues gracefully
+            return True
+    
+    def _categorize_exception(self, exception: Exception, path: Optional[str], context: str,
+                              exception_message: Optional[str] = None) -> ErrorCategory:
         """
         Categorize an exception based on its type and context.
         
@@ -128,46 +233,40 @@ class ErrorManager:
             exception: The exception to categorize
             path: Optional path where error occurred
             context: Context of the operation
+            exception_message: str(exception) if already computed by the caller
             
         Returns:
             ErrorCategory for the exception
         """
+        # Critical system errors (checked first: no message copy or keyword scans on Ctrl+C)
+        if type(exception) in _CRITICAL_TYPES:
+            return ErrorCategory.CRITICAL
+        
         exception_type = type(exception).__name__
-        exception_message = str(exception).lower()
+        if exception_message is None:
+            exception_message = str(exception)
         
         # Security-related errors
-        if any(keyword in exception_message for keyword in [
-            'access denied', 'permission denied', 'privilege', 'security',
-            'sid', 'owner', 'acl', 'security descriptor'
-        ]) or 'pywintypes.error' in exception_type:
+        if _SECURITY_KEYWORDS.search(exception_message) or 'pywintypes.error' in exception_type:
             return ErrorCategory.SECURITY
         
         # Filesystem-related errors
-        if any(keyword in exception_message for keyword in [
-            'file not found', 'path not found', 'directory not found',
-            'file in use', 'sharing violation', 'network', 'drive'
-        ]) or exception_type in ['FileNotFoundError', 'PermissionError', 'OSError']:
+        if _FILESYSTEM_KEYWORDS.search(exception_message) or exception_type in _FILESYSTEM_TYPES:
             return ErrorCategory.FILESYSTEM
         
         # Configuration-related errors
-        if any(keyword in exception_message for keyword in [
-            'invalid argument', 'invalid account', 'account not found',
-            'invalid path', 'invalid option'
-        ]) or exception_type in ['ValueError', 'TypeError']:
+        if _CONFIGURATION_KEYWORDS.search(exception_message) or exception_type in _CONFIGURATION_TYPES:
             return ErrorCategory.CONFIGURATION
         
         # Timeout-related errors
-        if 'timeout' in exception_message or exception_type == 'TimeoutError':
+        if _TIMEOUT_KEYWORDS.search(exception_message) or exception_type == 'TimeoutError':
             return ErrorCategory.TIMEOUT
         
-        # Critical system errors
-        if exception_type in ['SystemExit', 'KeyboardInterrupt', 'MemoryError']:
-            return ErrorCategory.CRITICAL
-        
         # Default to filesystem for most file operation errors
         return ErrorCategory.FILESYSTEM
     
-    def _format_error_message(self, exception: Exception, path: Optional[str], context: str) -> str:
+    def _format_error_message(self, exception: Exception, path: Optional[str], context: str,
+                              exception_message: Optional[str] = None) -> str:
         """
         Format a comprehensive error message.
         
@@ -175,11 +274,12 @@ class ErrorManager:
             exception: The exception that occurred
             path: Optional path where error occurred
             context: Context of the operation
+            exception_message: str(exception) if already computed by the caller
             
         Returns:
             Formatted error message
         """
-        base_message = str(exception)
+        base_message = exception_message if exception_message is not None else str(exception)
         
         # Add path information if available
         if path:
@@ -261,6 +361,9 @@ class ErrorManager:
         """
         Validate that the script is running with Administrator privileges.
         
+        The IsUserAnAdmin result is cached after the first successful check;
+        a missing privilege is still reported on every call.
+        
         Returns:
             True if running with Administrator privileges, False otherwise
             
@@ -268,10 +371,11 @@ class ErrorManager:
             SystemExit: If privileges are insufficient and critical validation is enabled
         """
         try:
-            # Check if running as Administrator
-            is_admin = ctypes.windll.shell32.IsUserAnAdmin()
+            # Check if running as Administrator (once per ErrorManager)
+            if self._is_admin is None:
+                self._is_admin = bool(ctypes.windll.shell32.IsUserAnAdmin())
             
-            if not is_admin:
+            if not self._is_admin:
                 error_info = ErrorInfo(
                     category=ErrorCategory.PRIVILEGE,
                     path=None,
@@ -308,7 +412,7 @@ class ErrorManager:
         """
         return ExceptionContext(self, operation, path)
     
-    def get_common_error_solutions(self, error_category: ErrorCategory) -> list[str]:
+    def get_common_error_solutions(self, error_category: ErrorCategory) -> tuple[str, ...]:
         """
         Get common solutions for different error categories.
         
@@ -316,38 +420,9 @@ class ErrorManager:
             error_category: Category of error
             
         Returns:
-            List of suggested solutions
+            Tuple of suggested solutions (shared, read-only)
         """
-        solutions = {
-            ErrorCategory.SECURITY: [
-                "Ensure the script is running with Administrator privileges",
-                "Check that the target account exists and is valid",
-                "Verify that the path is accessible and not locked by another process"
-            ],
-            ErrorCategory.FILESYSTEM: [
-                "Verify that the path exists and is accessible",
-                "Check that files are not in use by other applications",
-                "Ensure sufficient disk space is available",
-                "Check network connectivity if accessing network paths"
-            ],
-            ErrorCategory.CONFIGURATION: [
-                "Verify command-line arguments are correct",
-                "Check that the target owner account name is valid",
-                "Ensure the root path exists and is a directory"
-            ],
-            ErrorCategory.PRIVILEGE: [
-                "Run the script as Administrator",
-                "Right-click Command Prompt and select 'Run as administrator'",
-                "Ensure your account has the necessary privileges"
-            ],
-            ErrorCategory.TIMEOUT: [
-                "Increase the timeout value using -to option",
-                "Process smaller directory structures",
-                "Check system performance and available resources"
-            ]
-        }
-        
-        return solutions.get(error_category, ["Contact system administrator for assistance"])
+        return _COMMON_SOLUTIONS.get(error_category, _DEFAULT_SOLUTIONS)
     
     def create_failure_log_filename(self, operation: str, extension: str = "log") -> str:
         """
@@ -415,7 +490,7 @@ class ErrorManager:
         log_content = f"""
 === CRITICAL FAILURE LOG ===
 Timestamp: {timestamp}
-Category: {error_info.category.value}
+Category: {error_info.category.label}
 Path: {error_info.path or 'N/A'}
 Message: {error_info.message}
 Exception Type: {type(error_info.original_exception).__name__}
@@ -445,7 +520,9 @@ Traceback:
         import time
         timestamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())
         
-        log_content = f"""
+        # Collect the pieces and join them once: failure sets can be very large,
+        # and repeated string concatenation may copy the whole log per failure
+        log_parts = [f"""
 === {operation.upper()} FAILURES LOG ===
 Timestamp: {timestamp}
 Total Failures: {len(failures)}
@@ -453,34 +530,38 @@ Total Failures: {len(failures)}
 {summary}
 
 Failure Details:
-"""
+"""]
         
         for i, failure in enumerate(failures, 1):
             if isinstance(failure, ErrorInfo):
-                log_content += f"""
+                log_parts.append(f"""
 Failure #{i}:
   Path: {failure.path or 'N/A'}
-  Category: {failure.category.value}
+  Category: {failure.category.label}
   Message: {failure.message}
   Exception: {type(failure.original_exception).__name__}: {str(failure.original_exception)}
-"""
+""")
             else:
-                log_content += f"""
+                log_parts.append(f"""
 Failure #{i}: {str(failure)}
-"""
+""")
         
-        log_content += f"""
+        log_parts.append(f"""
 === END {operation.upper()} FAILURES LOG ===
-"""
+""")
         
-        self.write_failure_log(filename, log_content)
+        self.write_failure_log(filename, "".join(log_parts))
 
 
 class ExceptionContext:
     """
     Context manager for handling exceptions in specific operations.
+    
+    FileSystemWalker creates one per processed path, so instances use slots.
     """
     
+    __slots__ = ('error_manager', 'operation', 'path', 'error_occurred')
+    
     def __init__(self, error_manager: ErrorManager, operation: str, path: Optional[str] = None):
         """
         Initialize exception context.
@@ -6,7 +6,8 @@ between security operations, statistics tracking, and error handling to process
 directory structures efficiently and safely.
 
 Key Features:
-- Efficient directory traversal using os.walk() with recursion control
+- Iterative os.scandir() traversal with recursion control
+- Optional thread pool that overlaps blocking Windows security calls
 - Integration with SecurityManager for ownership operations
 - Comprehensive error handling that continues processing after failures
 - File and directory processing with configurable options
@@ -21,23 +22,81 @@ The FileSystemWalker serves as the main coordinator between:
 - TimeoutManager: For handling execution time limits
 
 Classes:
+    OwnershipResult: Outcome of examining a single path's ownership
+    FailureRecord: A path that could not be processed, kept for the failures log
     FileSystemWalker: Main filesystem traversal coordinator
 """
 
 import os
+import sys
+import threading
+from collections import deque
+from concurrent.futures import CancelledError, ThreadPoolExecutor
+from dataclasses import dataclass
 from typing import Optional
 
+# Import common utilities and constants
+try:
+    from .common import CHUNK_SIZE, TIMEOUT_CHECK_INTERVAL, extended_length_path
+except ImportError:
+    # Fall back to absolute imports (when run as a script)
+    from common import CHUNK_SIZE, TIMEOUT_CHECK_INTERVAL, extended_length_path
+
+# DirEntry.is_junction() is always False outside Windows, so the call is skipped there
+_IS_WINDOWS = sys.platform == "win32"
+
+
+@dataclass
+class OwnershipResult:
+    """
+    Outcome of examining (and optionally changing) the owner of a single path.
+    
+    The Windows security calls for a path are made by _examine_path, which may run
+    on a worker thread. The result is then recorded (statistics, SID tracking,
+    output, error reporting) on the walking thread so that reporting stays ordered
+    and single-threaded.
+    """
+    path: str
+    owner_name: Optional[str] = None
+    current_owner_sid: object = None
+    is_valid_owner: bool = True
+    owner_retrieved: bool = False
+    error: Optional[Exception] = None
+    error_deferred: bool = False  # error not yet passed to the ErrorManager
+
+
+@dataclass(slots=True, frozen=True)
+class FailureRecord:
+    """
+    A file or directory that could not be processed, for the failures log.
+    
+    Failure-heavy trees (for example, whole subtrees that deny access) can collect
+    very many of these, so the record uses slots rather than a per-entry dict.
+    """
+    path: str
+    error: str
+    exception_type: str
+
 
 class FileSystemWalker:
     """
     Handles filesystem traversal and coordinates ownership changes.
     
-    This class provides efficient directory traversal using os.walk() with
+    This class provides efficient directory traversal using os.scandir() with
     support for recursion control, file processing, and proper exception
     handling that continues processing after errors.
+    
+    When max_workers is greater than 1, the Windows security calls for each
+    directory (and its files) are submitted to a thread pool while the walking
+    thread keeps enumerating. Large directories are split into CHUNK_SIZE file
+    batches so that several workers can share them. Results are consumed in
+    submission order, so statistics, SID tracking and verbose output are
+    identical to a serial run. At most max_workers * 4 directories are pending
+    at once.
     """
     
-    def __init__(self, security_manager, stats_tracker, error_manager=None, sid_tracker=None):
+    def __init__(self, security_manager, stats_tracker, error_manager=None, sid_tracker=None,
+                 max_workers: int = 1):
         """
         Initialize FileSystemWalker with required dependencies.
         
@@ -46,30 +105,42 @@ class FileSystemWalker:
             stats_tracker: StatsTracker instance for counting operations
             error_manager: Optional ErrorManager for comprehensive error handling
             sid_tracker: Optional SidTracker for SID analysis and reporting
+            max_workers: Number of worker threads for ownership operations (1 = serial)
         """
         self.security_manager = security_manager
         self.stats_tracker = stats_tracker
         self.error_manager = error_manager
         self.sid_tracker = sid_tracker
+        self.max_workers = max(1, max_workers)
+        
+        # Cooperative cancellation flag shared with worker threads
+        self._cancel_event = threading.Event()
+        self._timeout_reported = False
         
         # Track failed files and directories for output directory logging
         self.failed_files = []
         self.failed_directories = []
+        
+        # Long-path mapping set by walk_filesystem on Windows (see _api_path)
+        self._display_root = None
+        self._display_prefix_length = 0
+        self._api_root = None
+        self._api_prefix = None
     
     def walk_filesystem(self, root_path: str, owner_sid: object, 
                        recurse: bool = False, process_files: bool = False,
                        execute: bool = False, output_manager=None, 
-                       timeout_manager=None) -> None:
+                       timeout_manager=None, skip_clean_subtrees: bool = False) -> None:
         """
         Traverse filesystem and process ownership changes with comprehensive error handling.
         
         This method serves as the main coordinator for filesystem traversal, using
-        Python's efficient os.walk() function to traverse directory structures while
+        an iterative os.scandir() walk to traverse directory structures while
         providing comprehensive error handling, timeout support, and integration
         with all other system components.
         
         Key Features:
-        - Efficient directory traversal using os.walk() with minimal memory usage
+        - Efficient directory traversal using os.scandir() with minimal memory usage
         - Recursion control based on user preferences (-r option)
         - Optional file processing in addition to directories (-f option)
         - Comprehensive exception handling that continues processing after errors
@@ -77,24 +148,43 @@ class FileSystemWalker:
         - Integration with SecurityManager for Windows security operations
         - Statistics tracking for all operations and errors
         - Verbose output support for detailed processing information
+        - Optional thread pool (max_workers > 1) with results recorded in walk order
         
         Processing Flow:
-        1. Use os.walk() to traverse directory structure efficiently
+        1. Use _walk_scandir() to traverse directory structure efficiently
         2. For each directory: check timeout, process ownership, update statistics
         3. If file processing enabled: process each file in current directory
-        4. Control recursion based on user preferences
+        4. Control recursion in _walk_scandir (without -r only the root is listed)
         5. Handle all exceptions gracefully to continue processing
         
         Args:
             root_path: Root directory path to start traversal from
             owner_sid: Target owner SID object for ownership changes
-            recurse: Whether to recurse into subdirectories (controls os.walk behavior)
+            recurse: Whether to recurse into subdirectories (controls traversal behavior)
             process_files: Whether to process files in addition to directories
             execute: Whether to apply changes (True) or perform dry run (False)
             output_manager: Optional OutputManager for user feedback and verbose logging
             timeout_manager: Optional TimeoutManager for execution time limit checking
+            skip_clean_subtrees: Whether to skip the subdirectories of directories that
+                are already owned by owner_sid. This is a lossy heuristic: NTFS sets an
+                owner from the creating principal rather than inheriting it, so orphaned
+                entries below such a directory are missed. Skipped subdirectories are
+                counted in the statistics.
         """
         try:
+            # LONG PATHS: On Windows the OS and security calls are given an absolute,
+            # extended-length form of each walked path (see _api_path) so that paths
+            # deeper than MAX_PATH_LENGTH can still be listed and secured. Output and
+            # logs keep the root in the form it was given.
+            self._api_prefix = None
+            if _IS_WINDOWS:
+                api_root = extended_length_path(os.path.abspath(root_path))
+                if api_root != root_path:
+                    self._display_root = root_path
+                    self._display_prefix_length = len(os.path.join(root_path, ""))
+                    self._api_root = api_root
+                    self._api_prefix = os.path.join(api_root, "")
+            
             # PROGRESS TRACKING: Count total top-level directories for progress display
             # This is only needed for verbosity level 1 to show "Processing top-level directory X/Y"
             top_level_dirs_total = 0
@@ -102,104 +192,132 @@ class FileSystemWalker:
             
             if output_manager and output_manager.is_level_1() and recurse:
                 # Count top-level directories by examining immediate children of root
+                # DirEntry.is_dir(follow_symlinks=False) reuses the type returned with
+                # the listing, so no entry needs an extra stat call. Symbolic links and
+                # junctions are not counted because _walk_scandir() does not enter them.
                 try:
-                    for item in os.listdir(root_path):
-                        item_path = os.path.join(root_path, item)
-                        if os.path.isdir(item_path):
-                            top_level_dirs_total += 1
+                    with os.scandir(self._api_path(root_path)) as entries:
+                        top_level_dirs_total = sum(
+                            1 for entry in entries
+                            if entry.is_dir(follow_symlinks=False)
+                            and not (_IS_WINDOWS and entry.is_junction())
+                        )
                 except (OSError, PermissionError):
                     # If we can't list the directory, we'll just proceed without progress counters
                     top_level_dirs_total = 0
             
-            # Use os.walk() for efficient directory traversal
-            # os.walk() yields (dirpath, dirnames, filenames) tuples for each directory
-            # This approach is memory-efficient as it processes one directory at a time
-            for dirpath, dirnames, filenames in os.walk(root_path):
-                
-                # TIMEOUT CHECK: Verify we haven't exceeded the execution time limit
-                # This check occurs at the directory level to provide reasonable granularity
-                # without excessive overhead from checking on every single file
-                if timeout_manager and timeout_manager.is_timeout_reached():
-                    if output_manager:
-                        output_manager.print_timeout_warning(
-                            timeout_manager.get_elapsed_time(),
-                            timeout_manager.timeout_seconds
-                        )
-                    # Break from the main loop to terminate processing gracefully
-                    break
-                
-                # DIRECTORY ENTRY: Announce entering directory for level 1+ verbosity
-                # Level 1 shows root and top-level directories, level 2+ shows all directories
-                is_root_dir = (dirpath == root_path)
-                is_top_level_dir = self._is_top_level_directory(dirpath, root_path)
-                
-                # PROGRESS TRACKING: Update counter for top-level directories
-                if is_top_level_dir and top_level_dirs_total > 0:
-                    top_level_dirs_current += 1
-                
-                if output_manager:
-                    # Pass progress information for top-level directories
+            # Reset cancellation state in case this walker is reused
+            self._cancel_event.clear()
+            self._timeout_reported = False
+            
+            # THREAD POOL: Overlap blocking Windows security calls when requested
+            # The walking thread keeps enumerating while workers examine ownership.
+            # A bounded window of pending directories keeps memory use predictable.
+            executor = None
+            pending = deque()
+            max_pending = self.max_workers * 4
+            if self.max_workers > 1:
+                executor = ThreadPoolExecutor(max_workers=self.max_workers,
+                                              thread_name_prefix="fix_owner")
+            
+            # Bind the timeout check once for the directory loop
+            is_timeout_reached = timeout_manager.is_timeout_reached if timeout_manager else None
+            
+            try:
+                # Use os.scandir() based traversal for efficient directory walking
+                # _walk_scandir() yields (dirpath, dirnames, filenames) tuples like os.walk(),
+                # plus the depth of dirpath below the root and the linked subdirectories
+                # This approach is memory-efficient as it processes one directory at a time
+                # RECURSION CONTROL: Without -r the walk stops after the root directory
+                for dirpath, dirnames, filenames, depth, linked_dirnames in self._walk_scandir(
+                        root_path, recurse):
+                    
+                    # TIMEOUT CHECK: Verify we haven't exceeded the execution time limit
+                    # This check occurs at the directory level to provide reasonable granularity
+                    # without excessive overhead from checking on every single file
+                    # It is not strided like the per-file check
+                    if is_timeout_reached and is_timeout_reached():
+                        self._stop_for_timeout(pending, output_manager, timeout_manager)
+                        # Break from the main loop to terminate processing gracefully
+                        break
+                    
+                    # DIRECTORY ENTRY: Determine directory position for level 1+ verbosity
+                    # Level 1 shows root and top-level directories, level 2+ shows all directories
+                    # Top-level directories are the immediate children of the root
+                    is_root_dir = (depth == 0)
+                    is_top_level_dir = (depth == 1)
+                    
+                    # PROGRESS TRACKING: Update counter for top-level directories
                     progress_info = None
                     if is_top_level_dir and top_level_dirs_total > 0:
+                        top_level_dirs_current += 1
                         progress_info = (top_level_dirs_current, top_level_dirs_total)
                     
-                    output_manager.print_entering_directory(
-                        dirpath, 
-                        is_root=is_root_dir, 
-                        is_top_level=is_top_level_dir,
-                        progress=progress_info
-                    )
-                
-                # DIRECTORY PROCESSING: Handle ownership for the current directory
-                # This processes the directory itself, not its contents
-                # Each directory is processed regardless of recursion settings
-                self._process_directory(dirpath, owner_sid, execute, output_manager)
-                
-                # FILE PROCESSING: Handle files in current directory if requested
-                # This only occurs when the -f/--files option is specified
-                # Files are processed after their containing directory
-                if process_files:
-                    for filename in filenames:
-                        # TIMEOUT CHECK: Also check timeout for individual files
-                        # This is important for directories with many files
-                        # Provides more responsive timeout handling in file-heavy directories
-                        if timeout_manager and timeout_manager.is_timeout_reached():
-                            if output_manager:
-                                output_manager.print_timeout_warning(
-                                    timeout_manager.get_elapsed_time(),
-                                    timeout_manager.timeout_seconds
-                                )
+                    # FILE SELECTION: Files are only processed with the -f/--files option
+                    directory_files = filenames if process_files else []
+                    directory_info = (dirpath, directory_files, is_root_dir, is_top_level_dir, progress_info)
+                    
+                    if executor:
+                        # PARALLEL: Submit the security calls, then finish the oldest
+                        # directories in submission order once the pending window is full
+                        # Files are batched in CHUNK_SIZE groups; the first batch also
+                        # examines the directory itself, unless pruning waits on it below
+                        prune_subtrees = skip_clean_subtrees and dirnames
+                        futures = []
+                        if prune_subtrees or not directory_files:
+                            futures.append(executor.submit(self._examine_directory, dirpath, [],
+                                                           owner_sid, execute, timeout_manager))
+                        futures.extend(
+                            executor.submit(self._examine_directory, dirpath,
+                                            directory_files[start:start + CHUNK_SIZE],
+                                            owner_sid, execute, timeout_manager,
+                                            start == 0 and not prune_subtrees)
+                            for start in range(0, len(directory_files), CHUNK_SIZE)
+                        )
+                        pending.append((directory_info, futures))
+                        
+                        # SUBTREE PRUNING: The directory's own result is needed before
+                        # the walk resumes and lists its children, so wait for it here
+                        # (its future examines only the directory, not a batch of files)
+                        if prune_subtrees:
+                            try:
+                                dir_result = futures[0].result()[0]
+                            except CancelledError:
+                                dir_result = None
+                            if self._is_clean_directory(dir_result, owner_sid):
+                                self._prune_subtrees(dirnames, linked_dirnames)
+                        
+                        if not self._drain_pending(pending, max_pending - 1, owner_sid, execute,
+                                                   output_manager, timeout_manager):
+                            break
+                    else:
+                        # SERIAL: Process the directory and its files on this thread
+                        # SUBTREE PRUNING: _handle_directory clears dirnames when the
+                        # directory is already owned by the target owner
+                        subdirs = dirnames if skip_clean_subtrees else None
+                        if not self._handle_directory(directory_info, owner_sid, execute,
+                                                      output_manager, timeout_manager,
+                                                      subdirs=subdirs,
+                                                      linked_subdirs=linked_dirnames):
+                            self._stop_for_timeout(pending, output_manager, timeout_manager)
                             # Return immediately to stop all processing
                             return
-                        
-                        # Construct full file path and process ownership
-                        file_path = os.path.join(dirpath, filename)
-                        self._process_file(file_path, owner_sid, execute, output_manager)
                 
-                # DIRECTORY SUMMARY: Show completion status for level 1+ verbosity
-                # Level 1 shows root and top-level directories, level 2+ shows all directories
-                if output_manager:
-                    # Pass progress information for top-level directories
-                    progress_info = None
-                    if is_top_level_dir and top_level_dirs_total > 0:
-                        progress_info = (top_level_dirs_current, top_level_dirs_total)
-                    
-                    output_manager.print_directory_summary(
-                        dirpath, 
-                        is_root=is_root_dir, 
-                        is_top_level=is_top_level_dir,
-                        progress=progress_info
-                    )
+                # DRAIN: Finish directories still pending in the thread pool
+                # After a timeout, work that already ran is still recorded because
+                # ownership may already have been changed on disk
+                self._drain_pending(pending, 0, owner_sid, execute,
+                                    output_manager, timeout_manager)
+            finally:
+                if executor:
+                    # Stop queued work that has not started and wait for running workers
+                    if pending:
+                        self._cancel_event.set()
+                    executor.shutdown(wait=True, cancel_futures=True)
                 
-                # RECURSION CONTROL: Manage subdirectory traversal
-                # os.walk() uses the dirnames list to determine which subdirectories to enter
-                # By clearing this list, we prevent os.walk() from descending into subdirectories
-                # This is more efficient than checking recursion settings in each iteration
-                if not recurse:
-                    # Clear the dirnames list to prevent os.walk from recursing
-                    # This must be done after processing the current directory
-                    # but before os.walk moves to the next iteration
-                    dirnames.clear()
+                # Write any output still buffered for an unfinished directory
+                if output_manager:
+                    output_manager.flush()
                     
         except KeyboardInterrupt:
             # Handle user interruption (Ctrl+C) gracefully
@@ -232,7 +350,8 @@ class FileSystemWalker:
             raise
     
     def _process_directory(self, dir_path: str, owner_sid: object, 
-                          execute: bool, output_manager=None) -> None:
+                          execute: bool, output_manager=None,
+                          result: Optional[OwnershipResult] = None) -> Optional[OwnershipResult]:
         """
         Process a single directory for ownership changes with comprehensive error handling.
         
@@ -247,6 +366,10 @@ class FileSystemWalker:
             owner_sid: Target owner SID object for ownership changes
             execute: Whether to apply changes (True) or perform dry run (False)
             output_manager: Optional OutputManager for user feedback and verbose logging
+            result: Optional OwnershipResult already computed on a worker thread
+            
+        Returns:
+            OwnershipResult for the directory, or None if processing it failed
         """
         # STATISTICS: Track that we've examined this directory
         # This count includes all directories, regardless of whether ownership changes
@@ -263,38 +386,35 @@ class FileSystemWalker:
             # This provides error categorization, recovery strategies, and consistent reporting
             try:
                 with self.error_manager.create_exception_context("Processing directory", dir_path):
-                    self._process_directory_ownership(dir_path, owner_sid, execute, output_manager)
+                    return self._process_directory_ownership(dir_path, owner_sid, execute,
+                                                             output_manager, result)
             except Exception as e:
                 # Collect failed directory for output directory logging even with ErrorManager
-                self.failed_directories.append({
-                    'path': dir_path,
-                    'error': str(e),
-                    'exception_type': type(e).__name__
-                })
+                self.failed_directories.append(FailureRecord(dir_path, str(e), type(e).__name__))
                 # Re-raise to let ErrorManager handle it properly
                 raise
         else:
             # FALLBACK: Basic error handling when ErrorManager is not available
             # This ensures the script can still function with minimal error handling
             try:
-                self._process_directory_ownership(dir_path, owner_sid, execute, output_manager)
+                return self._process_directory_ownership(dir_path, owner_sid, execute,
+                                                         output_manager, result)
             except Exception as e:
                 # Handle exception but continue processing other directories
                 # This is critical for robustness - one failed directory shouldn't stop everything
                 self.stats_tracker.increment_exceptions()
                 
                 # Collect failed directory for output directory logging
-                self.failed_directories.append({
-                    'path': dir_path,
-                    'error': str(e),
-                    'exception_type': type(e).__name__
-                })
+                self.failed_directories.append(FailureRecord(dir_path, str(e), type(e).__name__))
                 
                 if output_manager:
                     output_manager.print_error(dir_path, e, is_directory=True)
+        
+        return None
     
     def _process_directory_ownership(self, dir_path: str, owner_sid: object, 
-                                   execute: bool, output_manager=None) -> None:
+                                     execute: bool, output_manager=None,
+                                     result: Optional[OwnershipResult] = None) -> OwnershipResult:
         """
         Process directory ownership change with comprehensive validation and error handling.
         
@@ -310,54 +430,23 @@ class FileSystemWalker:
             owner_sid: Target owner SID object for ownership changes
             execute: Whether to apply changes (True) or perform dry run (False)
             output_manager: Optional OutputManager for user feedback and verbose logging
+            result: Optional OwnershipResult already computed on a worker thread
+            
+        Returns:
+            OwnershipResult for the directory
         """
-        # STEP 1: OWNERSHIP RETRIEVAL
-        # Get current owner information using SecurityManager
-        # This returns both the human-readable name (if valid) and the SID object
-        owner_name, current_owner_sid = self.security_manager.get_current_owner(dir_path)
-        
-        # SID TRACKING: Record SID occurrence if tracking is enabled
-        # This tracks all SIDs encountered, not just orphaned ones
-        if self.sid_tracker:
-            self.sid_tracker.track_directory_sid(dir_path, current_owner_sid)
-        
-        # STEP 2: SID VALIDATION
-        # Check if current owner SID is invalid/orphaned
-        # Invalid SIDs are exactly what we're looking for - they indicate
-        # ownership by accounts that no longer exist (deleted users, etc.)
-        is_valid_owner = self.security_manager.is_sid_valid(current_owner_sid)
-        
-        # VERBOSE OUTPUT: Show current directory being examined with ownership status
-        # This helps users track progress in verbose mode and shows accurate ownership info
-        if output_manager:
-            output_manager.print_examining_path(dir_path, is_directory=True, 
-                                              current_owner=owner_name, 
-                                              is_valid_owner=is_valid_owner)
+        # Serial processing performs the security calls here; parallel processing
+        # has already performed them on a worker thread
+        if result is None:
+            result = self._examine_path(dir_path, owner_sid, execute)
         
-        if not is_valid_owner:
-            
-            # STEP 3: OWNERSHIP CHANGE (if needed)
-            # Only change ownership if we're in execute mode
-            # In dry-run mode, we simulate the change for reporting purposes
-            if execute:
-                # Apply the actual ownership change using Windows Security APIs
-                self.security_manager.set_owner(dir_path, owner_sid)
-            
-            # STATISTICS: Track that we changed (or would change) this directory's ownership
-            # This count represents directories with orphaned ownership that were processed
-            self.stats_tracker.increment_dirs_changed()
-            
-            # USER FEEDBACK: Report the ownership change to the user
-            # This provides visibility into what the script is doing
-            if output_manager:
-                output_manager.print_ownership_change(
-                    dir_path, 
-                    is_directory=True, 
-                    dry_run=not execute  # Indicate whether this was a simulation
-                )
+        self._record_ownership(result, is_directory=True, execute=execute,
+                               output_manager=output_manager)
+        return result
     
     def _process_file(self, file_path: str, owner_sid: object, 
-                     execute: bool, output_manager=None) -> None:
+                     execute: bool, output_manager=None,
+                     result: Optional[OwnershipResult] = None) -> None:
         """
         Process a single file for ownership changes with comprehensive error handling.
         
@@ -372,6 +461,7 @@ class FileSystemWalker:
             owner_sid: Target owner SID object for ownership changes
             execute: Whether to apply changes (True) or perform dry run (False)
             output_manager: Optional OutputManager for user feedback and verbose logging
+            result: Optional OwnershipResult already computed on a worker thread
         """
         # STATISTICS: Track that we've examined this file
         # This count includes all files, regardless of whether ownership changes
@@ -388,38 +478,31 @@ class FileSystemWalker:
             # This provides error categorization, recovery strategies, and consistent reporting
             try:
                 with self.error_manager.create_exception_context("Processing file", file_path):
-                    self._process_file_ownership(file_path, owner_sid, execute, output_manager)
+                    self._process_file_ownership(file_path, owner_sid, execute, output_manager, result)
             except Exception as e:
                 # Collect failed file for output directory logging even with ErrorManager
-                self.failed_files.append({
-                    'path': file_path,
-                    'error': str(e),
-                    'exception_type': type(e).__name__
-                })
+                self.failed_files.append(FailureRecord(file_path, str(e), type(e).__name__))
                 # Re-raise to let ErrorManager handle it properly
                 raise
         else:
             # FALLBACK: Basic error handling when ErrorManager is not available
             # This ensures the script can still function with minimal error handling
             try:
-                self._process_file_ownership(file_path, owner_sid, execute, output_manager)
+                self._process_file_ownership(file_path, owner_sid, execute, output_manager, result)
             except Exception as e:
                 # Handle exception but continue processing other files
                 # This is critical for robustness - one failed file shouldn't stop everything
                 self.stats_tracker.increment_exceptions()
                 
                 # Collect failed file for output directory logging
-                self.failed_files.append({
-                    'path': file_path,
-                    'error': str(e),
-                    'exception_type': type(e).__name__
-                })
+                self.failed_files.append(FailureRecord(file_path, str(e), type(e).__name__))
                 
                 if output_manager:
                     output_manager.print_error(file_path, e, is_directory=False)
     
     def _process_file_ownership(self, file_path: str, owner_sid: object, 
-                              execute: bool, output_manager=None) -> None:
+                                execute: bool, output_manager=None,
+                                result: Optional[OwnershipResult] = None) -> None:
         """
         Process file ownership change with comprehensive validation and error handling.
         
@@ -435,76 +518,480 @@ class FileSystemWalker:
             owner_sid: Target owner SID object for ownership changes
             execute: Whether to apply changes (True) or perform dry run (False)
             output_manager: Optional OutputManager for user feedback and verbose logging
+            result: Optional OwnershipResult already computed on a worker thread
         """
-        # STEP 1: OWNERSHIP RETRIEVAL
-        # Get current owner information using SecurityManager
-        # This returns both the human-readable name (if valid) and the SID object
-        owner_name, current_owner_sid = self.security_manager.get_current_owner(file_path)
+        # Serial processing performs the security calls here; parallel processing
+        # has already performed them on a worker thread
+        if result is None:
+            result = self._examine_path(file_path, owner_sid, execute)
         
-        # SID TRACKING: Record SID occurrence if tracking is enabled
-        # This tracks all SIDs encountered, not just orphaned ones
-        if self.sid_tracker:
-            self.sid_tracker.track_file_sid(file_path, current_owner_sid)
+        self._record_ownership(result, is_directory=False, execute=execute,
+                               output_manager=output_manager)
+    
+    def _walk_scandir(self, root_path: str, recurse: bool = True):
+        """
+        Iterative top-down directory walk built on os.scandir().
         
-        # STEP 2: SID VALIDATION
-        # Check if current owner SID is invalid/orphaned
-        # Invalid SIDs are exactly what we're looking for - they indicate
-        # ownership by accounts that no longer exist (deleted users, etc.)
-        is_valid_owner = self.security_manager.is_sid_valid(current_owner_sid)
+        Yields (dirpath, dirnames, filenames, depth, linked_dirnames) tuples in the
+        same order as os.walk(), where depth is 0 for the root, 1 for its immediate
+        children, and so on, and linked_dirnames is the set of names in dirnames
+        that the walk will not enter. Entry types come from the DirEntry data returned with the directory
+        listing (FindFirstFile/FindNextFile on Windows), so no extra stat call is
+        needed per entry. An explicit stack replaces recursion so very deep trees
+        cannot hit Python's recursion limit.
         
-        # VERBOSE OUTPUT: Show current file being examined with ownership status
-        # This helps users track progress in verbose mode and shows accurate ownership info
+        As with os.walk(), the caller may clear or edit dirnames to prune the walk,
+        symbolic links to directories are listed but not followed, and directories
+        that cannot be listed are skipped silently. Directory junctions are treated
+        like symbolic links, so a subtree reachable through a junction is only
+        processed at its real location.
+        
+        Args:
+            root_path: Root directory path to start traversal from
+            recurse: Whether to descend into subdirectories (False yields only the root)
+            
+        Yields:
+            Tuple of (dirpath, dirnames, filenames, depth, linked_dirnames) for each
+            directory visited
+        """
+        api_path = self._api_path
+        stack = [(root_path, 0)]
+        while stack:
+            dir_path, depth = stack.pop()
+            dirnames = []
+            filenames = []
+            linked_dirnames = set()
+            
+            try:
+                with os.scandir(api_path(dir_path)) as entries:
+                    for entry in entries:
+                        try:
+                            is_dir = entry.is_dir()
+                        except OSError:
+                            is_dir = False
+                        
+                        if is_dir:
+                            dirnames.append(entry.name)
+                            # Junctions (mount points) are not symlinks to DirEntry, but
+                            # following them would revisit or loop back into subtrees
+                            if entry.is_symlink() or (_IS_WINDOWS and entry.is_junction()):
+                                linked_dirnames.add(entry.name)
+                        else:
+                            filenames.append(entry.name)
+            except OSError:
+                # Unreadable directory - skip it like os.walk() does by default
+                continue
+            
+            yield dir_path, dirnames, filenames, depth, linked_dirnames
+            
+            if not recurse:
+                break
+            
+            # Push subdirectories in reverse so they are visited in listing order
+            # Join the directory once; dirnames may have been edited by the caller,
+            # so paths are rebuilt from names rather than taken from the DirEntry
+            dir_prefix = os.path.join(dir_path, "")
+            child_depth = depth + 1
+            for dirname in reversed(dirnames):
+                if dirname not in linked_dirnames:
+                    stack.append((dir_prefix + dirname, child_depth))
+    
+    def _api_path(self, path: str) -> str:
+        """
+        Return the form of a walked path to pass to the OS and security APIs.
+        
+        Walked paths keep the root in the form it was given, for output and logs.
+        When walk_filesystem has set up an extended-length root (Windows), the
+        path is rebased onto that root instead.
+        
+        Args:
+            path: The walk's root or a path below it
+            
+        Returns:
+            The extended-length form of path, or path itself when no mapping is set
+        """
+        api_prefix = self._api_prefix
+        if api_prefix is None:
+            return path
+        if path == self._display_root:
+            return self._api_root
+        return api_prefix + path[self._display_prefix_length:]
+    
+    def _handle_directory(self, directory_info: tuple, owner_sid: object, execute: bool,
+                          output_manager=None, timeout_manager=None, futures=None,
+                          subdirs: Optional[list] = None,
+                          linked_subdirs: frozenset = frozenset()) -> bool:
+        """
+        Process one directory (and its selected files) and report it to the user.
+        
+        In serial mode the ownership work is performed here. In parallel mode the
+        work has already been submitted to the thread pool, and this method records
+        the worker's results so that output and statistics stay in walk order.
+        
+        Args:
+            directory_info: Tuple of (dir_path, filenames, is_root, is_top_level, progress)
+            owner_sid: Target owner SID object for ownership changes
+            execute: Whether to apply changes (True) or perform dry run (False)
+            output_manager: Optional OutputManager for user feedback and verbose logging
+            timeout_manager: Optional TimeoutManager for execution time limit checking
+            futures: Optional list of Futures returned by submitting _examine_directory
+            subdirs: Optional subdirectory names from the walk, cleared (serial mode only)
+                when the directory is already owned by owner_sid
+            linked_subdirs: Names in subdirs that the walk does not enter (links)
+            
+        Returns:
+            True if the directory was fully processed, False if the timeout was reached
+        """
+        dir_path, filenames, is_root_dir, is_top_level_dir, progress_info = directory_info
+        
+        if futures is not None:
+            dir_result, file_results, completed = self._collect_results(futures)
+            if dir_result is None and not file_results:
+                # Workers were cancelled before they touched this directory
+                return completed
+        
+        # DIRECTORY ENTRY: Announce entering directory for level 1+ verbosity
         if output_manager:
-            output_manager.print_examining_path(file_path, is_directory=False, 
-                                              current_owner=owner_name, 
-                                              is_valid_owner=is_valid_owner)
+            output_manager.print_entering_directory(
+                dir_path, 
+                is_root=is_root_dir, 
+                is_top_level=is_top_level_dir,
+                progress=progress_info
+            )
         
-        if not is_valid_owner:
+        if futures is None:
+            # DIRECTORY PROCESSING: Handle ownership for the current directory
+            # This processes the directory itself, not its contents
+            # Each directory is processed regardless of recursion settings
+            dir_result = self._process_directory(dir_path, owner_sid, execute, output_manager)
+            if subdirs and self._is_clean_directory(dir_result, owner_sid):
+                self._prune_subtrees(subdirs, linked_subdirs)
             
-            # STEP 3: OWNERSHIP CHANGE (if needed)
-            # Only change ownership if we're in execute mode
-            # In dry-run mode, we simulate the change for reporting purposes
-            if execute:
-                # Apply the actual ownership change using Windows Security APIs
-                self.security_manager.set_owner(file_path, owner_sid)
+            # FILE PROCESSING: Handle files in current directory if requested
+            # Files are processed after their containing directory
+            # os.path.join(dir, "") adds a separator only when needed, so
+            # prefix + filename equals os.path.join(dir, filename) for listed names
+            file_prefix = os.path.join(dir_path, "")
             
-            # STATISTICS: Track that we changed (or would change) this file's ownership
-            # This count represents files with orphaned ownership that were processed
-            self.stats_tracker.increment_files_changed()
+            # HOT LOOP: Bind per-file lookups to locals once per directory
+            process_file = self._process_file
+            is_timeout_reached = timeout_manager.is_timeout_reached if timeout_manager else None
+            for index, filename in enumerate(filenames):
+                # TIMEOUT CHECK: Also check timeout within file-heavy directories
+                # Checked on the first file and then every TIMEOUT_CHECK_INTERVAL files,
+                # which keeps the clock read out of most iterations while still
+                # stopping promptly in directories with many files
+                if (is_timeout_reached and not index % TIMEOUT_CHECK_INTERVAL
+                        and is_timeout_reached()):
+                    return False
+                
+                # Construct full file path and process ownership
+                process_file(file_prefix + filename, owner_sid, execute, output_manager)
+        else:
+            # RESULT RECORDING: Security calls already ran on a worker thread
+            if dir_result is not None:
+                self._process_directory(dir_path, owner_sid, execute, output_manager,
+                                        result=dir_result)
+            process_file = self._process_file
+            for file_result in file_results:
+                process_file(file_result.path, owner_sid, execute, output_manager,
+                             result=file_result)
+            if not completed:
+                return False
+        
+        # DIRECTORY SUMMARY: Show completion status for level 1+ verbosity
+        # Level 1 shows root and top-level directories, level 2+ shows all directories
+        if output_manager:
+            output_manager.print_directory_summary(
+                dir_path, 
+                is_root=is_root_dir, 
+                is_top_level=is_top_level_dir,
+                progress=progress_info
+            )
+        
+        return True
+    
+    def _prune_subtrees(self, dirnames: list, linked_dirnames) -> None:
+        """
+        Clear dirnames so the walk skips them, counting the subtrees skipped.
+        
+        Linked subdirectories are not counted, since the walk never enters them.
+        
+        Args:
+            dirnames: Subdirectory names from the walk, cleared in place
+            linked_dirnames: Names in dirnames that are symbolic links or junctions
+        """
+        skipped = len(dirnames) - sum(1 for name in dirnames if name in linked_dirnames)
+        if skipped:
+            self.stats_tracker.increment_subtrees_skipped(skipped)
+        dirnames.clear()
+    
+    def _is_clean_directory(self, result: Optional[OwnershipResult], owner_sid: object) -> bool:
+        """
+        Check whether a directory's subtree may be skipped (--skip-clean-subtrees).
+        
+        A directory qualifies when its current owner resolved to an account and is
+        the target owner itself. A directory that was just given the target owner
+        does not qualify: its contents were never examined and may be orphaned too.
+        Even a qualifying directory says nothing certain about its contents, since
+        owners are not inherited, so skipping is a heuristic the user opts into.
+        
+        Args:
+            result: OwnershipResult for the directory, or None if processing failed
+            owner_sid: Target owner SID object for ownership changes
             
-            # USER FEEDBACK: Report the ownership change to the user
-            # This provides visibility into what the script is doing
-            if output_manager:
-                output_manager.print_ownership_change(
-                    file_path,
-                    is_directory=False,
-                    dry_run=not execute  # Indicate whether this was a simulation
+        Returns:
+            True if the directory's contents can be skipped, False otherwise
+        """
+        # PySID equality compares the underlying SIDs (EqualSid)
+        return (result is not None and result.error is None and result.is_valid_owner
+                and result.current_owner_sid == owner_sid)
+    
+    def _collect_results(self, futures: list) -> tuple:
+        """
+        Combine the results of a directory's batches in submission order.
+        
+        Results from every batch that ran are kept, even after a timeout, because
+        ownership may already have been changed on disk.
+        
+        Args:
+            futures: List of Futures returned by submitting _examine_directory
+            
+        Returns:
+            Tuple of (directory OwnershipResult or None, list of file OwnershipResults,
+            True if every batch completed)
+        """
+        dir_result = None
+        file_results = []
+        completed = True
+        for index, future in enumerate(futures):
+            if future.cancelled():
+                completed = False
+                continue
+            batch_dir_result, batch_file_results, batch_completed = future.result()
+            if index == 0:
+                dir_result = batch_dir_result
+            file_results.extend(batch_file_results)
+            completed = completed and batch_completed
+        return dir_result, file_results, completed
+    
+    def _examine_directory(self, dir_path: str, filenames: list, owner_sid: object,
+                           execute: bool, timeout_manager=None,
+                           include_directory: bool = True) -> tuple:
+        """
+        Worker-thread task: examine a directory and/or one batch of its files.
+        
+        Only the Windows security calls are made here; statistics, SID tracking
+        and output are left to the walking thread.
+        
+        Args:
+            dir_path: Full path to the directory to examine
+            filenames: Names of files in the directory to examine (may be empty)
+            owner_sid: Target owner SID object for ownership changes
+            execute: Whether to apply changes (True) or perform dry run (False)
+            timeout_manager: Optional TimeoutManager for execution time limit checking
+            include_directory: Whether to examine the directory itself (at most one batch)
+            
+        Returns:
+            Tuple of (directory OwnershipResult or None, list of file OwnershipResults,
+            True if all work completed before cancellation or timeout)
+        """
+        if self._cancel_event.is_set():
+            return None, [], False
+        
+        dir_result = None
+        if include_directory:
+            dir_result = self._examine_path(dir_path, owner_sid, execute, report_errors=False)
+        
+        # HOT LOOP: Bind per-file lookups to locals once per batch
+        # This loop runs once per file, so attribute and global lookups add up
+        file_results = []
+        append_result = file_results.append
+        examine_path = self._examine_path
+        is_cancelled = self._cancel_event.is_set
+        is_timeout_reached = timeout_manager.is_timeout_reached if timeout_manager else None
+        
+        # Join the directory once; listed names are never absolute, so plain
+        # concatenation matches os.path.join(dir_path, filename)
+        file_prefix = os.path.join(dir_path, "")
+        
+        for index, filename in enumerate(filenames):
+            # CANCELLATION: Stop promptly once the walk has been stopped
+            if is_cancelled():
+                return dir_result, file_results, False
+            
+            # TIMEOUT CHECK: Same granularity as serial processing (first file of
+            # the batch, then every TIMEOUT_CHECK_INTERVAL files)
+            if (is_timeout_reached and not index % TIMEOUT_CHECK_INTERVAL
+                    and is_timeout_reached()):
+                self._cancel_event.set()
+                return dir_result, file_results, False
+            
+            append_result(examine_path(file_prefix + filename, owner_sid, execute,
+                                       report_errors=False))
+        
+        return dir_result, file_results, True
+    
+    def _drain_pending(self, pending: deque, keep: int, owner_sid: object, execute: bool,
+                       output_manager=None, timeout_manager=None) -> bool:
+        """
+        Record pending thread pool results, oldest first, until at most keep remain.
+        
+        Args:
+            pending: Deque of (directory_info, futures) tuples in submission order
+            keep: Number of pending directories that may remain outstanding
+            owner_sid: Target owner SID object for ownership changes
+            execute: Whether to apply changes (True) or perform dry run (False)
+            output_manager: Optional OutputManager for user feedback and verbose logging
+            timeout_manager: Optional TimeoutManager for execution time limit checking
+            
+        Returns:
+            True if no timeout occurred while recording results, False otherwise
+        """
+        completed = True
+        while len(pending) > keep:
+            directory_info, futures = pending.popleft()
+            if not self._handle_directory(directory_info, owner_sid, execute,
+                                          output_manager, timeout_manager, futures):
+                self._stop_for_timeout(pending, output_manager, timeout_manager)
+                completed = False
+        return completed
+    
+    def _stop_for_timeout(self, pending: deque, output_manager=None, timeout_manager=None) -> None:
+        """
+        Stop outstanding work after a timeout and warn the user once.
+        
+        Args:
+            pending: Deque of (directory_info, futures) tuples still outstanding
+            output_manager: Optional OutputManager for user feedback
+            timeout_manager: TimeoutManager that reported the timeout
+        """
+        self._cancel_event.set()
+        for _, futures in pending:
+            for future in futures:
+                future.cancel()
+        
+        if not self._timeout_reported:
+            self._timeout_reported = True
+            if output_manager and timeout_manager:
+                output_manager.print_timeout_warning(
+                    timeout_manager.get_elapsed_time(),
+                    timeout_manager.timeout_seconds
                 )
     
-    def _is_top_level_directory(self, dir_path: str, root_path: str) -> bool:
+    def _examine_path(self, path: str, owner_sid: object, execute: bool,
+                      report_errors: bool = True) -> OwnershipResult:
         """
-        Determine if a directory is a top-level directory (immediate child of root).
+        Perform the Windows security calls for a single path.
+        
+        This method is safe to run on a worker thread: it only talks to the
+        SecurityManager and captures any failure in the returned result instead
+        of raising it, so that it can be reported on the walking thread.
         
         Args:
-            dir_path: Directory path to check
-            root_path: Root directory path
+            path: Full path to the file or directory to examine
+            owner_sid: Target owner SID object for ownership changes
+            execute: Whether to apply changes (True) or perform dry run (False)
+            report_errors: Whether SecurityManager reports failures to the ErrorManager
+                itself (False on worker threads; _record_ownership reports them instead)
             
         Returns:
-            True if dir_path is an immediate child of root_path, False otherwise
+            OwnershipResult describing the current owner and any error encountered
+        """
+        result = OwnershipResult(path=path)
+        api_path = self._api_path(path)
+        try:
+            # STEP 1: OWNERSHIP RETRIEVAL
+            # Get current owner information using SecurityManager
+            # This returns both the human-readable name (if valid) and the SID object
+            result.owner_name, result.current_owner_sid = self.security_manager.get_current_owner(
+                path, api_path=api_path, report_errors=report_errors)
+            result.owner_retrieved = True
+            
+            # STEP 2: SID VALIDATION
+            # Check if current owner SID is invalid/orphaned
+            # Invalid SIDs are exactly what we're looking for - they indicate
+            # ownership by accounts that no longer exist (deleted users, etc.)
+            # get_current_owner already resolved the SID: no name means orphaned,
+            # so a separate is_sid_valid() lookup would only repeat that work
+            result.is_valid_owner = result.owner_name is not None
+            
+            # STEP 3: OWNERSHIP CHANGE (if needed)
+            # Only change ownership if we're in execute mode
+            # In dry-run mode, we simulate the change for reporting purposes
+            if not result.is_valid_owner and execute:
+                # Apply the actual ownership change using Windows Security APIs
+                # Passing the owner just read lets set_owner skip re-reading the descriptor
+                self.security_manager.set_owner(path, owner_sid, result.current_owner_sid,
+                                                api_path=api_path, report_errors=report_errors)
+        except Exception as e:
+            result.error = e
+            result.error_deferred = not report_errors
+        
+        return result
+    
+    def _record_ownership(self, result: OwnershipResult, is_directory: bool,
+                          execute: bool, output_manager=None) -> None:
+        """
+        Record the outcome of _examine_path: SID tracking, statistics and output.
+        
+        Any error captured during examination is re-raised at the same point at
+        which it would have occurred in serial processing. Errors from worker
+        threads are passed to the ErrorManager here first, so that it is only
+        ever called from the walking thread.
+        
+        Args:
+            result: OwnershipResult produced by _examine_path
+            is_directory: True if the path is a directory, False for files
+            execute: Whether changes were applied (True) or simulated (False)
+            output_manager: Optional OutputManager for user feedback and verbose logging
         """
-        # Normalize paths to handle different path separators
-        normalized_root = os.path.normpath(root_path)
-        normalized_dir = os.path.normpath(dir_path)
+        # ERROR REPORTING: Hand worker-thread failures to the ErrorManager on this thread
+        if result.error_deferred:
+            self.security_manager.report_error(
+                result.error.__cause__ or result.error, result.path,
+                "Setting ownership" if result.owner_retrieved else "Getting current owner"
+            )
         
-        # If it's the root directory itself, it's not a top-level directory
-        if normalized_dir == normalized_root:
-            return False
+        if not result.owner_retrieved:
+            raise result.error
         
-        # Get the parent directory of the current directory
-        parent_dir = os.path.dirname(normalized_dir)
+        # SID TRACKING: Record SID occurrence if tracking is enabled
+        # This tracks all SIDs encountered, not just orphaned ones
+        if self.sid_tracker:
+            if is_directory:
+                self.sid_tracker.track_directory_sid(result.path, result.current_owner_sid)
+            else:
+                self.sid_tracker.track_file_sid(result.path, result.current_owner_sid)
         
-        # If the parent is the root, then this is a top-level directory
-        return parent_dir == normalized_root
+        # VERBOSE OUTPUT: Show current path being examined with ownership status
+        # This helps users track progress in verbose mode and shows accurate ownership info
+        if output_manager:
+            output_manager.print_examining_path(result.path, is_directory=is_directory, 
+                                              current_owner=result.owner_name, 
+                                              is_valid_owner=result.is_valid_owner)
+        
+        if not result.is_valid_owner:
+            
+            # The ownership change was attempted and failed
+            if result.error is not None:
+                raise result.error
+            
+            # STATISTICS: Track that we changed (or would change) this path's ownership
+            # This count represents paths with orphaned ownership that were processed
+            if is_directory:
+                self.stats_tracker.increment_dirs_changed()
+            else:
+                self.stats_tracker.increment_files_changed()
+            
+            # USER FEEDBACK: Report the ownership change to the user
+            # This provides visibility into what the script is doing
+            if output_manager:
+                output_manager.print_ownership_change(
+                    result.path, 
+                    is_directory=is_directory, 
+                    dry_run=not execute  # Indicate whether this was a simulation
+                )
     
     def write_failed_files_log(self) -> None:
         """
@@ -542,37 +1029,19 @@ Review each failure to determine if manual intervention is required.
 """
         
         # Combine all failures into a single list for logging
-        all_failures = []
-        
-        # Add directory failures
-        for failure in self.failed_directories:
-            all_failures.append({
-                'type': 'Directory',
-                'path': failure['path'],
-                'error': failure['error'],
-                'exception_type': failure['exception_type']
-            })
-        
-        # Add file failures
-        for failure in self.failed_files:
-            all_failures.append({
-                'type': 'File',
-                'path': failure['path'],
-                'error': failure['error'],
-                'exception_type': failure['exception_type']
-            })
+        all_failures = [('Directory', failure) for failure in self.failed_directories]
+        all_failures.extend(('File', failure) for failure in self.failed_files)
         
         # Sort failures by path for easier review
-        all_failures.sort(key=lambda x: x['path'])
+        all_failures.sort(key=lambda item: item[1].path)
         
         # Convert to formatted strings for the error manager
-        formatted_failures = []
-        for failure in all_failures:
-            formatted_failures.append(
-                f"{failure['type']}: {failure['path']}\n"
-                f"  Error: {failure['error']}\n"
-                f"  Exception: {failure['exception_type']}"
-            )
+        formatted_failures = [
+            f"{failure_type}: {failure.path}\n"
+            f"  Error: {failure.error}\n"
+            f"  Exception: {failure.exception_type}"
+            for failure_type, failure in all_failures
+        ]
         
         # Write the failures log using the error manager
         self.error_manager.log_operation_failures(
@@ -34,12 +34,16 @@ USAGE:
     
     Options:
         -x, --execute   Apply ownership changes (default: dry run)
-        -r, --recurse   Recurse into subdirectories
+        -r, --recurse   Recurse into subdirectories (symbolic links and junctions are not followed)
         -f, --files     Process files in addition to directories
         -v, --verbose LEVEL   Verbose output level: 0=statistics only, 1=top-level directory status, 2=directory progress, 3=detailed examination
         -q, --quiet     Suppress all output including statistics
         -to SECONDS     Timeout after specified seconds (0 = no timeout)
         -ts, --track-sids   Enable SID tracking and generate ownership analysis report
+        -th, --threads N    Worker threads for ownership operations (default: 1 = serial)
+        -sc, --skip-clean-subtrees   Do not descend into directories already owned by the target owner
+                                     (lossy heuristic: owners are not inherited, so orphaned
+                                     entries below them are missed)
 
 EXAMPLES:
     # Basic dry run to see what would be changed (safest first step)
@@ -113,7 +117,7 @@ SECURITY CONSIDERATIONS:
     - Target owner account is validated before processing begins
 
 PERFORMANCE NOTES:
-    - Uses efficient os.walk() for directory traversal
+    - Uses an iterative os.scandir() walk that reuses cached directory entry types
     - Processes items incrementally to minimize memory usage
     - Supports timeout to prevent indefinite execution on large structures
     - Exception handling allows processing to continue after individual failures
@@ -124,6 +128,8 @@ LICENSE: Internal Use Only
 """
 
 import argparse
+import functools
+import importlib.util
 import os
 import sys
 import time
@@ -131,18 +137,16 @@ from dataclasses import dataclass, field
 from typing import Optional
 
 # YAML support for remediation file reading
-try:
-    import yaml
-    YAML_AVAILABLE = True
-except ImportError:
-    YAML_AVAILABLE = False
+# PyYAML is only needed for --yaml-remediation, so it is located here but imported
+# lazily by load_yaml_remediation() instead of on every run
+YAML_AVAILABLE = importlib.util.find_spec("yaml") is not None
 
 # Import common utilities and constants
 try:
     from .common import (
         section_clr, error_clr, warn_clr, reset_clr, COLORAMA_AVAILABLE,
         SCRIPT_VERSION, MAX_PATH_LENGTH, EXIT_SUCCESS, EXIT_ERROR, EXIT_INTERRUPTED,
-        PYWIN32_AVAILABLE, safe_exit, validate_path_exists, validate_path_is_directory,
+        PYWIN32_AVAILABLE, safe_exit, classify_path,
         setup_module_path, get_execution_start_timestamp
     )
 except ImportError:
@@ -150,7 +154,7 @@ except ImportError:
     from common import (
         section_clr, error_clr, warn_clr, reset_clr, COLORAMA_AVAILABLE,
         SCRIPT_VERSION, MAX_PATH_LENGTH, EXIT_SUCCESS, EXIT_ERROR, EXIT_INTERRUPTED,
-        PYWIN32_AVAILABLE, safe_exit, validate_path_exists, validate_path_is_directory,
+        PYWIN32_AVAILABLE, safe_exit, classify_path,
         setup_module_path, get_execution_start_timestamp
     )
 
@@ -182,7 +186,7 @@ except ImportError:
 
 
 
-@dataclass
+@dataclass(slots=True)
 class ExecutionOptions:
     """Configuration options for script execution."""
     execute: bool = False          # -x flag: Apply changes vs dry run
@@ -192,6 +196,8 @@ class ExecutionOptions:
     quiet: bool = False            # -q flag: Suppress all output
     timeout: int = 0               # -ts value: Timeout in seconds
     track_sids: bool = False       # -ts/--track-sids flag: Enable SID tracking
+    threads: int = 1               # -th/--threads value: Worker threads for ownership operations
+    skip_clean_subtrees: bool = False  # -sc/--skip-clean-subtrees flag: Prune subtrees owned by the target
     yaml_remediation: str = ""     # -yr/--yaml-remediation: YAML remediation file
     root_path: str = ""            # Positional argument: Root path to process
     owner_account: str = ""        # Target owner account
@@ -199,7 +205,7 @@ class ExecutionOptions:
     start_timestamp_str: str = ""  # Formatted timestamp for filenames
 
 
-@dataclass
+@dataclass(slots=True)
 class ExecutionStats:
     """Statistics tracking for script execution."""
     dirs_traversed: int = 0
@@ -207,27 +213,24 @@ class ExecutionStats:
     dirs_changed: int = 0
     files_changed: int = 0
     exceptions: int = 0
-    start_time: float = field(default_factory=time.time)
+    start_time: float = field(default_factory=time.perf_counter)  # Monotonic, unlike time.time()
     
     def get_elapsed_time(self) -> float:
         """Get elapsed time since start."""
-        return time.time() - self.start_time
+        return time.perf_counter() - self.start_time
 
 
 
-def parse_arguments() -> argparse.Namespace:
+@functools.lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
     """
-    Parse and validate command-line arguments with comprehensive validation.
+    Build the command-line parser with all supported options.
     
-    This function sets up the argument parser with all supported options,
-    validates argument combinations, and ensures the root path exists and
-    is accessible before proceeding with execution.
+    The parser is built once and reused, so scripts that import this module and
+    call parse_arguments() repeatedly do not rebuild it each time.
     
     Returns:
-        Parsed arguments namespace containing all validated options
-        
-    Raises:
-        SystemExit: If arguments are invalid, help is requested, or validation fails
+        ArgumentParser configured with the positional arguments and options
     """
     parser = argparse.ArgumentParser(
         description="Recursively take ownership of directories/files with orphaned SIDs.",
@@ -254,7 +257,8 @@ def parse_arguments() -> argparse.Namespace:
     parser.add_argument(
         '-r', '--recurse',
         action='store_true',
-        help='Recurse into subdirectories'
+        help='Recurse into subdirectories. Symbolic links and directory junctions are not '
+             'followed; their targets are only processed at their real location'
     )
     parser.add_argument(
         '-f', '--files',
@@ -285,6 +289,19 @@ def parse_arguments() -> argparse.Namespace:
         action='store_true',
         help='Enable SID tracking and generate ownership analysis report'
     )
+    parser.add_argument(
+        '-th', '--threads',
+        type=int,
+        default=1,
+        metavar='N',
+        help='Number of worker threads for ownership operations (default: 1 = serial)'
+    )
+    parser.add_argument(
+        '-sc', '--skip-clean-subtrees',
+        action='store_true',
+        help='Do not descend into directories already owned by the target owner. Lossy '
+             'heuristic: NTFS does not inherit owners, so orphaned entries below them are missed'
+    )
     parser.add_argument(
         '-yr', '--yaml-remediation',
         type=str,
@@ -292,7 +309,28 @@ def parse_arguments() -> argparse.Namespace:
         help='Read remediation plan from YAML file in current directory (uses new_owner_account for ownership changes)'
     )
     
-    args = parser.parse_args()
+    return parser
+
+
+def parse_arguments(argv: Optional[list] = None) -> argparse.Namespace:
+    """
+    Parse and validate command-line arguments with comprehensive validation.
+    
+    This function parses the command line with the shared parser from
+    _build_parser(), validates argument combinations, and ensures the root path
+    exists and is accessible before proceeding with execution.
+    
+    Args:
+        argv: Optional argument list to parse instead of sys.argv[1:]
+        
+    Returns:
+        Parsed arguments namespace containing all validated options
+        
+    Raises:
+        SystemExit: If arguments are invalid, help is requested, or validation fails
+    """
+    parser = _build_parser()
+    args = parser.parse_args(argv)
     
     # Validate argument combinations
     if args.verbose and args.quiet:
@@ -301,6 +339,9 @@ def parse_arguments() -> argparse.Namespace:
     if args.timeout < 0:
         parser.error("Timeout value must be non-negative")
     
+    if args.threads < 1:
+        parser.error("Thread count must be at least 1")
+    
     # Validate YAML remediation and owner account combination
     if args.yaml_remediation and args.owner_account:
         parser.error("Cannot specify both owner_account and --yaml-remediation options (YAML file provides the owner account)")
@@ -309,10 +350,12 @@ def parse_arguments() -> argparse.Namespace:
         # This is allowed - will use current user as default
         pass
     
-    if not validate_path_exists(args.root_path):
+    # One stat call answers both the existence and the directory check
+    root_kind = classify_path(args.root_path)
+    if root_kind == 'missing':
         parser.error(f"Root path does not exist: {args.root_path}")
     
-    if not validate_path_is_directory(args.root_path):
+    if root_kind != 'dir':
         parser.error(f"Root path is not a directory: {args.root_path}")
     
     return args
@@ -395,15 +438,18 @@ def load_yaml_remediation(yaml_filename: str, output: OutputManager) -> Optional
         output.print_general_error("PyYAML is not installed. Install with: pip install PyYAML")
         safe_exit(EXIT_ERROR)
     
-    yaml_path = os.path.join(os.getcwd(), yaml_filename)
+    import yaml
     
-    if not os.path.exists(yaml_path):
-        output.print_general_error(f"YAML remediation file not found: {yaml_path}")
-        safe_exit(EXIT_ERROR)
+    # Use the libyaml-backed loader when PyYAML was built with it
+    safe_loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+    
+    yaml_path = os.path.join(os.getcwd(), yaml_filename)
     
+    # A missing file is reported from open() below rather than probed first
     try:
-        with open(yaml_path, 'r', encoding='utf-8') as file:
-            yaml_data = yaml.safe_load(file)
+        # Read bytes: both loaders detect the encoding (UTF-8 or a UTF-16 BOM) themselves
+        with open(yaml_path, 'rb') as file:
+            yaml_data = yaml.load(file, Loader=safe_loader)
         
         if not yaml_data:
             output.print_general_error(f"YAML file is empty or invalid: {yaml_filename}")
@@ -441,6 +487,9 @@ def load_yaml_remediation(yaml_filename: str, output: OutputManager) -> Optional
         output.print_general_message("Expected structure: orphaned_sids[0].recommended_remediation.new_owner_account")
         safe_exit(EXIT_ERROR)
         
+    except FileNotFoundError:
+        output.print_general_error(f"YAML remediation file not found: {yaml_path}")
+        safe_exit(EXIT_ERROR)
     except yaml.YAMLError as e:
         output.print_general_error(f"Error parsing YAML file {yaml_filename}: {e}")
         safe_exit(EXIT_ERROR)
@@ -478,7 +527,8 @@ def process_filesystem(options: ExecutionOptions, owner_sid: object,
     """
     # Create FileSystemWalker instance with all required dependencies
     # The walker coordinates between security operations, statistics tracking, and error handling
-    walker = FileSystemWalker(security_manager, stats, error_manager, sid_tracker)
+    walker = FileSystemWalker(security_manager, stats, error_manager, sid_tracker,
+                              max_workers=options.threads)
     
     # Log the start of filesystem processing in verbose mode
     if output.get_verbose_level() >= 1:
@@ -488,6 +538,10 @@ def process_filesystem(options: ExecutionOptions, owner_sid: object,
         output.print_info_pair("Recursion", 'enabled' if options.recurse else 'disabled')
         if options.timeout > 0:
             output.print_info_pair("Timeout", f"{options.timeout} seconds")
+        if options.threads > 1:
+            output.print_info_pair("Worker threads", str(options.threads))
+        if options.skip_clean_subtrees:
+            output.print_info_pair("Clean subtrees", "skipped")
     
     # Delegate filesystem processing to the FileSystemWalker
     # This is where the actual traversal and ownership changes occur
@@ -498,7 +552,8 @@ def process_filesystem(options: ExecutionOptions, owner_sid: object,
         process_files=options.files,
         execute=options.execute,
         output_manager=output,
-        timeout_manager=timeout_manager
+        timeout_manager=timeout_manager,
+        skip_clean_subtrees=options.skip_clean_subtrees
     )
     
     # Write failed files log to output directory after processing completes
@@ -551,6 +606,8 @@ def main() -> None:
             quiet=args.quiet,              # Whether to suppress all output
             timeout=args.timeout,          # Maximum execution time in seconds
             track_sids=args.track_sids,    # Whether to enable SID tracking
+            threads=args.threads,          # Worker threads for ownership operations
+            skip_clean_subtrees=args.skip_clean_subtrees,  # Prune subtrees owned by the target
             yaml_remediation=args.yaml_remediation or "",  # YAML remediation file
             root_path=args.root_path,      # Starting directory for processing
             owner_account=args.owner_account or "",  # Target owner account
@@ -569,6 +626,10 @@ def main() -> None:
             quiet=args.quiet
         )
         
+        # The verbosity level is fixed for the run, so read it once for the
+        # level 1 messages below
+        show_details = output.get_verbose_level() >= 1
+        
         # Print opening information
         output.print_general_message("fix_owner - a utility to change the owner on sets of Windows 11 files")
         output.print_info_pair("Script version", SCRIPT_VERSION)
@@ -597,7 +658,7 @@ def main() -> None:
         # This prevents accidental modifications and sets user expectations
         if options.execute:
             output.print_execution_mode_notice()
-            if output.get_verbose_level() >= 1:
+            if show_details:
                 output.print_general_message("Changes will be applied to filesystem")
         else:
             output.print_dry_run_notice()
@@ -611,7 +672,7 @@ def main() -> None:
                 original_owner = options.owner_account
                 options.owner_account = yaml_owner_account
                 
-                if output.get_verbose_level() >= 1:
+                if show_details:
                     if original_owner:
                         output.print_general_message(f"Owner account overridden by YAML remediation:")
                         output.print_info_pair("  Original", original_owner)
@@ -633,7 +694,7 @@ def main() -> None:
                 start_timestamp_str=options.start_timestamp_str,
                 target_owner_account=resolved_owner_name
             )
-            if output.get_verbose_level() >= 1:
+            if show_details:
                 output.print_general_message("SID tracking enabled - ownership analysis will be generated")
         
         # PHASE 7: Operation startup information and logging
@@ -646,7 +707,7 @@ def main() -> None:
         )
         
         # Log additional configuration details in verbose mode
-        if output.get_verbose_level() >= 1:
+        if show_details:
             output.print_info_pair("Maximum path length", str(MAX_PATH_LENGTH))
             if options.timeout > 0:
                 output.print_info_pair("Execution timeout", f"{options.timeout} seconds")
@@ -659,14 +720,14 @@ def main() -> None:
         # This ensures graceful termination for long-running operations
         if options.timeout > 0:
             timeout_manager.setup_timeout_handler()
-            if output.get_verbose_level() >= 1:
+            if show_details:
                 output.print_general_message("Timeout handler configured")
         
         try:
             # PHASE 9: Main filesystem processing
             # This is where the actual work happens - traverse directories and fix ownership
             # All error handling and recovery is managed by the individual components
-            if output.get_verbose_level() >= 1:
+            if show_details:
                 output.print_general_message(f"\n{section_clr}{'=' * 50}{reset_clr}")
                 output.print_general_message(f"{section_clr}BEGINNING FILESYSTEM PROCESSING{reset_clr}")
                 output.print_general_message(f"{section_clr}{'=' * 50}{reset_clr}")
@@ -674,14 +735,14 @@ def main() -> None:
             process_filesystem(options, owner_sid, stats, output, timeout_manager, security_manager, error_manager, sid_tracker)
             
             # Print terminating bars after filesystem processing
-            if output.get_verbose_level() >= 1:
+            if show_details:
                 output.print_general_message(f"{section_clr}{'=' * 50}{reset_clr}")
             
         finally:
             # PHASE 10: Cleanup and resource management
             # Always cleanup timeout resources, even if processing was interrupted
             timeout_manager.cancel_timeout()
-            if output.get_verbose_level() >= 1:
+            if show_details:
                 output.print_general_message("Timeout handler cleaned up")
         
         # PHASE 10: Completion notification and final reporting
@@ -698,7 +759,7 @@ def main() -> None:
             sid_tracker.generate_report(output)
         
         # Log successful completion in verbose mode
-        if output.get_verbose_level() >= 1:
+        if show_details:
             output.print_general_message("Script execution completed successfully")
         
     except KeyboardInterrupt:
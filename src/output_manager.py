@@ -34,13 +34,13 @@ from enum import Enum
 try:
     from .common import (
         info_lt_clr, info_dk_clr, section_clr, error_clr, warn_clr, ok_clr, reset_clr,
-        COLORAMA_AVAILABLE
+        COLORAMA_AVAILABLE, OUTPUT_BUFFER_LINES, enable_console_colors
     )
 except ImportError:
     # Fall back to absolute imports (when run as a script)
     from common import (
         info_lt_clr, info_dk_clr, section_clr, error_clr, warn_clr, ok_clr, reset_clr,
-        COLORAMA_AVAILABLE
+        COLORAMA_AVAILABLE, OUTPUT_BUFFER_LINES, enable_console_colors
     )
 
 
@@ -73,6 +73,8 @@ class OutputManager:
     - Quiet mode that suppresses all output
     - Colored output for better visual tracking
     - Consistent formatting for all messages and statistics
+    
+    Lines are buffered and written in batches of OUTPUT_BUFFER_LINES.
     """
     
     def __init__(self, verbose_level: int = 0, quiet: bool = False, 
@@ -97,6 +99,10 @@ class OutputManager:
             self.level = OutputLevel.LEVEL_1
         else:
             self.level = OutputLevel.LEVEL_0
+        
+        # Prepare the console for colored output unless everything is suppressed
+        if not quiet:
+            enable_console_colors()
             
         self.config = OutputConfig(
             level=self.level,
@@ -110,6 +116,23 @@ class OutputManager:
         self.files_needing_change = 0
         self.total_dirs_processed = 0
         self.total_files_processed = 0
+        
+        # Per-directory output buffer: lines written between entering a directory
+        # and its summary are joined and written in one call (None = not buffering)
+        self._buffer = None
+        
+        # HOT PATH SPECIALIZATION: The walker calls these once per path, but below level 2
+        # they never print, so bind the non-printing variants once instead of testing
+        # the level on every call
+        if self.level.value < OutputLevel.LEVEL_2.value:
+            self.print_examining_path = self._count_examined_path
+            self.print_ownership_change = self._skip_ownership_change
+        
+        # Below level 1 no directory messages are printed either, so the per-directory
+        # counter resets, buffering and summary formatting are skipped as well
+        if self.level.value < OutputLevel.LEVEL_1.value:
+            self.print_entering_directory = self._skip_directory_message
+            self.print_directory_summary = self._skip_directory_message
     
     def is_quiet(self) -> bool:
         """Check if quiet mode is enabled."""
@@ -157,6 +180,10 @@ class OutputManager:
             is_top_level: True if this is a top-level directory (immediate child of root)
             progress: Optional tuple of (current, total) for progress tracking
         """
+        # Start buffering output for this directory (flushes any unfinished directory)
+        self.flush()
+        self._buffer = []
+        
         # Reset counters for new directory
         self.current_directory = path
         self.dirs_needing_change = 0
@@ -182,6 +209,10 @@ class OutputManager:
             color = f"{info_lt_clr}"  # Using info_lt_clr for emphasis
             self._write_output(f"{color}→ Entering directory: {path}")
     
+    def _skip_directory_message(self, path: str, is_root: bool = False, is_top_level: bool = False,
+                                progress: tuple = None) -> None:
+        """Directory enter/summary message for levels that print neither (used below level 1)."""
+    
     def print_directory_summary(self, path: str, is_root: bool = False, is_top_level: bool = False, progress: tuple = None) -> None:
         """
         Print summary when finishing a directory.
@@ -234,6 +265,9 @@ class OutputManager:
             else:
                 self._write_output(f"{color}✓ Completed {path}: No ownership changes needed "
                                  f"({self.total_dirs_processed} dirs, {self.total_files_processed} files processed)")
+        
+        # Write everything collected for this directory in a single call
+        self.flush()
     
     def print_examining_path(self, path: str, is_directory: bool = True, 
                            current_owner: str = None, is_valid_owner: bool = True) -> None:
@@ -250,14 +284,7 @@ class OutputManager:
             is_valid_owner: True if current owner is valid, False if orphaned
         """
         # Track items for directory summaries
-        if is_directory:
-            self.total_dirs_processed += 1
-            if not is_valid_owner:
-                self.dirs_needing_change += 1
-        else:
-            self.total_files_processed += 1
-            if not is_valid_owner:
-                self.files_needing_change += 1
+        self._count_examined_path(path, is_directory, current_owner, is_valid_owner)
         
         if self.config.level.value >= OutputLevel.LEVEL_2.value:
             path_type = "DIR " if is_directory else "FILE"
@@ -284,6 +311,32 @@ class OutputManager:
                 elif not is_valid_owner:
                     self._write_output(f"  {path_color}Processing file: {path} {owner_color}[ORPHANED]")
     
+    def _count_examined_path(self, path: str, is_directory: bool = True, 
+                             current_owner: str = None, is_valid_owner: bool = True) -> None:
+        """
+        Track an examined path for directory summaries without printing it.
+        
+        Used directly as print_examining_path below level 2.
+        
+        Args:
+            path: Path being examined
+            is_directory: True if path is a directory, False if file
+            current_owner: Current owner of the path
+            is_valid_owner: True if current owner is valid, False if orphaned
+        """
+        if is_directory:
+            self.total_dirs_processed += 1
+            if not is_valid_owner:
+                self.dirs_needing_change += 1
+        else:
+            self.total_files_processed += 1
+            if not is_valid_owner:
+                self.files_needing_change += 1
+    
+    def _skip_ownership_change(self, path: str, is_directory: bool = True, 
+                               dry_run: bool = False, new_owner: str = None) -> None:
+        """Ownership change message for levels that do not print it (used below level 2)."""
+    
     def print_ownership_change(self, path: str, is_directory: bool = True, 
                              dry_run: bool = False, new_owner: str = None) -> None:
         """
@@ -472,20 +525,56 @@ class OutputManager:
         if self.config.level != OutputLevel.QUIET:
             self._write_output(f"{info_dk_clr}{description}: {info_lt_clr}{value}{reset_clr}")
     
+    def flush(self) -> None:
+        """
+        Write any buffered directory output and stop buffering.
+        
+        Called automatically after each directory summary; callers should also
+        call it when traversal stops early (timeout, interruption).
+        """
+        buffer = self._buffer
+        self._buffer = None
+        if buffer:
+            self._write_text("".join(buffer))
+    
     def _write_output(self, message: str) -> None:
         """
         Write message to output stream.
         
+        While a directory is being processed the line is buffered instead of
+        written, so verbose output costs one write per directory rather than
+        one per file. Directories with many files are written in batches of
+        OUTPUT_BUFFER_LINES lines, which bounds memory use and keeps progress
+        visible.
+        
         Args:
             message: Message to write
         """
+        # Colors are reset at the end of every line
+        line = f"{message}{reset_clr}\n"
+        buffer = self._buffer
+        if buffer is not None:
+            buffer.append(line)
+            if len(buffer) >= OUTPUT_BUFFER_LINES:
+                self._write_text("".join(buffer))
+                buffer.clear()
+            return
+        self._write_text(line)
+    
+    def _write_text(self, text: str) -> None:
+        """
+        Write already formatted text to the output stream and flush it.
+        
+        Args:
+            text: Text to write, including line endings
+        """
         try:
-            print(message, file=self.config.output_stream)
+            self.config.output_stream.write(text)
             self.config.output_stream.flush()
         except Exception:
             # Fallback to stderr if stdout fails
             try:
-                print(message, file=sys.stderr)
+                sys.stderr.write(text)
                 sys.stderr.flush()
             except Exception:
                 pass  # Silently ignore if both streams fail
@@ -497,6 +586,12 @@ class OutputManager:
         Args:
             message: Error message to write
         """
+        # Keep errors in order with buffered directory output
+        if self._buffer:
+            self._write_text("".join(self._buffer))
+            self._buffer.clear()
+        
+        message = f"{message}{reset_clr}"
         try:
             print(message, file=self.config.error_stream)
             self.config.error_stream.flush()
@@ -8,6 +8,7 @@ including SID validation, ownership retrieval, and ownership changes.
 Key Features:
 - Get current owner of files and directories with SID resolution
 - Validate SIDs to identify orphaned/invalid ownership
+- Cache SID-to-account lookups so repeated owners avoid domain controller round trips
 - Set ownership of files and directories safely
 - Resolve account names to SIDs for ownership operations
 - Integration with ErrorManager for comprehensive error handling
@@ -17,14 +18,15 @@ Classes:
     SecurityManager: Main Windows security operations coordinator
 """
 
+import threading
 from typing import Optional
 
 # Import common utilities and constants
 try:
-    from .common import PYWIN32_AVAILABLE
+    from .common import PYWIN32_AVAILABLE, SID_CACHE_SIZE
 except ImportError:
     # Fall back to absolute imports (when run as a script)
-    from common import PYWIN32_AVAILABLE
+    from common import PYWIN32_AVAILABLE, SID_CACHE_SIZE
 
 # Windows security imports (availability checked in common)
 if PYWIN32_AVAILABLE:
@@ -32,6 +34,9 @@ if PYWIN32_AVAILABLE:
     import win32api
     import win32con
 
+# LookupAccountSid error meaning that no account maps to the SID (an orphaned owner)
+ERROR_NONE_MAPPED = 1332
+
 
 class SecurityManager:
     """
@@ -48,6 +53,12 @@ class SecurityManager:
     - Setting new ownership on files/directories
     - Resolving account names to SIDs for ownership operations
     - Error handling and integration with ErrorManager
+    
+    LookupAccountSid results (including ERROR_NONE_MAPPED failures, which
+    identify orphaned SIDs) are cached per SID. On domain-joined machines each
+    lookup can be a network round trip, while most paths in a tree share a
+    handful of owners. With the cache there is one round trip per distinct
+    owner.
     """
     
     def __init__(self, error_manager=None):
@@ -63,8 +74,18 @@ class SecurityManager:
         if not PYWIN32_AVAILABLE:
             raise ImportError("pywin32 module is required for security operations")
         self.error_manager = error_manager
+        
+        # SID lookup cache: str(sid) -> "DOMAIN\\name" owner name, or None for orphaned SIDs
+        # Protected by a lock because FileSystemWalker may call in from worker threads
+        self._sid_lookup_cache = {}
+        self._sid_cache_lock = threading.Lock()
+        
+        # In-flight lookups: str(sid) -> Event set when the result is cached
+        # Concurrent misses on the same SID wait for one RPC instead of each issuing their own
+        self._sid_lookups_in_flight = {}
     
-    def get_current_owner(self, path: str) -> tuple[Optional[str], object]:
+    def get_current_owner(self, path: str, api_path: Optional[str] = None,
+                          report_errors: bool = True) -> tuple[Optional[str], object]:
         """
         Get current owner of a file or directory using Windows Security APIs.
         
@@ -79,6 +100,10 @@ class SecurityManager:
         
         Args:
             path: Path to examine (file or directory)
+            api_path: Optional form of path to pass to the Windows APIs, such as its
+                extended-length form; path is still used in messages
+            report_errors: Whether to pass a failure to the ErrorManager here. Callers on
+                worker threads pass False and call report_error() from their own thread.
             
         Returns:
             Tuple of (owner_name, owner_sid). owner_name is None if SID is invalid/orphaned,
@@ -90,36 +115,27 @@ class SecurityManager:
         try:
             # Step 1: Get the security descriptor for the file/directory
             # OWNER_SECURITY_INFORMATION flag requests only owner information for efficiency
-            sd = win32security.GetFileSecurity(path, win32security.OWNER_SECURITY_INFORMATION)
+            sd = win32security.GetFileSecurity(
+                api_path or path, win32security.OWNER_SECURITY_INFORMATION
+            )
             
             # Extract the owner SID from the security descriptor
             # This SID uniquely identifies the owner account
             owner_sid = sd.GetSecurityDescriptorOwner()
             
-            try:
-                # Step 2: Attempt to resolve SID to account name
-                # LookupAccountSid converts SID to human-readable name and domain
-                name, domain, _ = win32security.LookupAccountSid(None, owner_sid)
-                
-                # Format as DOMAIN\\USERNAME or just USERNAME if no domain
-                owner_name = f"{domain}\\{name}" if domain else name
-                return owner_name, owner_sid
-                
-            except Exception:
-                # SID resolution failed - this indicates an orphaned/invalid SID
-                # The SID exists but doesn't correspond to any current account
-                # This is exactly what we want to detect and fix
-                return None, owner_sid
+            # Step 2: Attempt to resolve SID to account name (cached)
+            # LookupAccountSid converts SID to human-readable name and domain
+            # None means SID resolution failed - this indicates an orphaned/invalid SID
+            # The SID exists but doesn't correspond to any current account
+            # This is exactly what we want to detect and fix
+            owner_name = self._lookup_account_sid(owner_sid)
+            return owner_name, owner_sid
                 
         except Exception as e:
             # Handle errors in getting security information
-            if self.error_manager:
-                error_info = self.error_manager.handle_exception(
-                    e, path=path, context="Getting current owner"
-                )
-                if error_info.should_terminate:
-                    raise
-            raise Exception(f"Failed to get owner information for '{path}': {e}")
+            if report_errors:
+                self.report_error(e, path, "Getting current owner")
+            raise Exception(f"Failed to get owner information for '{path}': {e}") from e
     
     def is_sid_valid(self, sid: object) -> bool:
         """
@@ -129,23 +145,94 @@ class SecurityManager:
         succeeds, the SID is valid and corresponds to an existing account. If it fails,
         the SID is orphaned/invalid and represents ownership that should be changed.
         
+        The answer is memoized per SID (see _lookup_account_sid), including for
+        orphaned SIDs, so callers do not need a validity cache of their own.
+        
         Args:
             sid: SID object to validate
             
         Returns:
             True if SID corresponds to an existing account, False if orphaned/invalid
+            
+        Raises:
+            Exception: If the lookup fails for a reason other than ERROR_NONE_MAPPED
+        """
+        # Attempt to resolve SID to account name (cached)
+        # If this succeeds, the SID is valid and corresponds to an existing account
+        # If it fails with ERROR_NONE_MAPPED, the SID is orphaned - the condition we're
+        # looking for; any other failure is raised
+        return self._lookup_account_sid(sid) is not None
+    
+    def _lookup_account_sid(self, sid: object) -> Optional[str]:
+        """
+        Resolve a SID to its formatted account name, caching the outcome.
+        
+        Successful lookups and ERROR_NONE_MAPPED failures are cached, since orphaned
+        SIDs tend to repeat across every path that a deleted account used to own.
+        Likewise, paths already owned by the target account (the bulk of a tree after a
+        migration) reach LookupAccountSid only once, for the first such path.
+        Any other failure (an unreachable domain controller, for instance) says
+        nothing about the SID, so it is not cached and is raised to the caller.
+        Entries are keyed by str(sid), the SID's string form, so equal SIDs read
+        from different security descriptors share one entry. The name is cached
+        already formatted, so repeat owners cost no string building. When several
+        worker threads miss on the same SID at once, only the first performs the
+        lookup; the others wait for its result.
+        
+        Args:
+            sid: SID object to resolve
+            
+        Returns:
+            Account name as DOMAIN\\USERNAME (or just USERNAME if there is no
+            domain), or None if the SID is orphaned/invalid
+            
+        Raises:
+            Exception: If the lookup fails for a reason other than ERROR_NONE_MAPPED
         """
+        key = str(sid)
+        with self._sid_cache_lock:
+            if key in self._sid_lookup_cache:
+                return self._sid_lookup_cache[key]
+            
+            # SINGLE FLIGHT: Wait for a lookup of this SID already running on another thread
+            in_flight = self._sid_lookups_in_flight.get(key)
+            if in_flight is None:
+                self._sid_lookups_in_flight[key] = threading.Event()
+        
+        if in_flight is not None:
+            in_flight.wait()
+            with self._sid_cache_lock:
+                if key in self._sid_lookup_cache:
+                    return self._sid_lookup_cache[key]
+            # Result was evicted, or that lookup failed and was not cached - look it up again
+            return self._lookup_account_sid(sid)
+        
+        # Perform the lookup outside the lock so slow RPCs don't serialize workers
+        account = None
+        cacheable = False
         try:
-            # Attempt to resolve SID to account name
-            # If this succeeds, the SID is valid and corresponds to an existing account
-            win32security.LookupAccountSid(None, sid)
-            return True
-        except Exception:
-            # LookupAccountSid failed - SID is orphaned/invalid
-            # This is the condition we're looking for to identify ownership that needs fixing
-            return False
+            name, domain, _ = win32security.LookupAccountSid(None, sid)
+            account = f"{domain}\\{name}" if domain else name
+            cacheable = True
+        except Exception as e:
+            # Only ERROR_NONE_MAPPED identifies an orphaned SID; anything else is raised
+            # uncached so the path is recorded as failed rather than treated as orphaned
+            if getattr(e, 'winerror', None) != ERROR_NONE_MAPPED:
+                raise
+            cacheable = True
+        finally:
+            with self._sid_cache_lock:
+                if cacheable:
+                    # Evict the oldest entry once the cache is full
+                    if len(self._sid_lookup_cache) >= SID_CACHE_SIZE:
+                        self._sid_lookup_cache.pop(next(iter(self._sid_lookup_cache)))
+                    self._sid_lookup_cache[key] = account
+                self._sid_lookups_in_flight.pop(key).set()
+        
+        return account
     
-    def set_owner(self, path: str, owner_sid: object) -> bool:
+    def set_owner(self, path: str, owner_sid: object, current_owner_sid: object = None,
+                  api_path: Optional[str] = None, report_errors: bool = True) -> bool:
         """
         Set ownership of a file or directory using Windows Security APIs.
         
@@ -154,23 +241,55 @@ class SecurityManager:
         2. Modifies the owner SID in the security descriptor
         3. Applies the modified security descriptor back to the file/directory
         
+        If the path is already owned by owner_sid, the write is skipped. No
+        account lookup is performed here; SID validity comes from the cached
+        lookups used by get_current_owner and is_sid_valid.
+        
+        When the caller already knows the current owner (FileSystemWalker reads it
+        via get_current_owner), passing it as current_owner_sid lets the equality
+        check run before any system call and skips re-reading the descriptor, so
+        the only call left that can fail is SetFileSecurity itself.
+        
         The operation requires appropriate privileges (typically Administrator) to succeed.
         The method preserves all other security information and only changes the owner.
+        Ownership is set one path at a time: subtree calls such as
+        TreeSetNamedSecurityInfo would also replace owners that are still valid.
         
         Args:
             path: Path to change ownership (file or directory)
             owner_sid: SID of new owner account
+            current_owner_sid: Optional owner SID already read from the path
+            api_path: Optional form of path to pass to the Windows APIs, such as its
+                extended-length form; path is still used in messages
+            report_errors: Whether to pass a failure to the ErrorManager here. Callers on
+                worker threads pass False and call report_error() from their own thread.
             
         Returns:
-            True if ownership was successfully changed
+            True if ownership was successfully changed (or already set to owner_sid)
             
         Raises:
             Exception: If unable to set ownership due to permissions or other errors
         """
+        # LBYL: Compare against the owner the caller already read before touching the file
+        # PySID equality compares the underlying SIDs (EqualSid)
+        if current_owner_sid is not None and current_owner_sid == owner_sid:
+            return True
+        
+        api_path = api_path or path
         try:
-            # Step 1: Get current security descriptor
-            # We need the existing descriptor to modify only the owner portion
-            sd = win32security.GetFileSecurity(path, win32security.OWNER_SECURITY_INFORMATION)
+            if current_owner_sid is None:
+                # Step 1: Get current security descriptor
+                # We need the existing descriptor to modify only the owner portion
+                sd = win32security.GetFileSecurity(api_path, win32security.OWNER_SECURITY_INFORMATION)
+                
+                # Skip the write when the path is already owned by the target account
+                if sd.GetSecurityDescriptorOwner() == owner_sid:
+                    return True
+            else:
+                # Step 1 (owner already known): No read needed - SetFileSecurity only
+                # applies the parts named by OWNER_SECURITY_INFORMATION, so an empty
+                # descriptor carrying just the new owner changes nothing else
+                sd = win32security.SECURITY_DESCRIPTOR()
             
             # Step 2: Set the new owner SID in the security descriptor
             # The second parameter (False) indicates we're not setting a group owner
@@ -178,19 +297,39 @@ class SecurityManager:
             
             # Step 3: Apply the modified security descriptor back to the file/directory
             # This is where the actual ownership change occurs
-            win32security.SetFileSecurity(path, win32security.OWNER_SECURITY_INFORMATION, sd)
+            win32security.SetFileSecurity(api_path, win32security.OWNER_SECURITY_INFORMATION, sd)
             
             return True
             
         except Exception as e:
             # Handle ownership change errors through ErrorManager if available
-            if self.error_manager:
-                error_info = self.error_manager.handle_exception(
-                    e, path=path, context="Setting ownership"
-                )
-                if error_info.should_terminate:
-                    raise
-            raise Exception(f"Failed to set owner for '{path}': {e}")
+            if report_errors:
+                self.report_error(e, path, "Setting ownership")
+            raise Exception(f"Failed to set owner for '{path}': {e}") from e
+    
+    def report_error(self, exception: Exception, path: str, context: str) -> None:
+        """
+        Pass a failed security operation to the ErrorManager, if one is configured.
+        
+        The ErrorManager prints, counts and may end the run, so it is only called
+        from the thread that owns the output. get_current_owner and set_owner call
+        this themselves unless report_errors=False is passed.
+        
+        Args:
+            exception: The exception raised by the Windows security API
+            path: Path that the operation was performed on
+            context: Description of the operation (e.g. "Getting current owner")
+            
+        Raises:
+            Exception: The original exception, if the ErrorManager decides it should
+                terminate execution
+        """
+        if self.error_manager:
+            error_info = self.error_manager.handle_exception(
+                exception, path=path, context=context
+            )
+            if error_info.should_terminate:
+                raise exception
     
     def resolve_owner_account(self, account_name: Optional[str]) -> tuple[object, str]:
         """
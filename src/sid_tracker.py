@@ -17,17 +17,16 @@ Classes:
     SidTracker: Main SID tracking and reporting coordinator
 """
 
+import importlib.util
 import json
 import time
 from typing import Dict, Tuple, Optional
 from collections import defaultdict
 
 # YAML support with fallback
-try:
-    import yaml
-    YAML_AVAILABLE = True
-except ImportError:
-    YAML_AVAILABLE = False
+# PyYAML is only needed for the remediation export, so it is imported lazily
+# by export_orphaned_sids_to_yaml() rather than whenever this module loads
+YAML_AVAILABLE = importlib.util.find_spec("yaml") is not None
 
 # Import common utilities and constants
 try:
@@ -55,6 +54,9 @@ class SidTracker:
     every SID encountered during filesystem traversal, categorizes them by
     validity (valid vs orphaned), and generates detailed reports showing
     the distribution of ownership across the processed filesystem.
+    
+    FileSystemWalker calls the track methods once per path as each result is
+    recorded.
     """
     
     def __init__(self, security_manager=None, start_timestamp_str=None, target_owner_account=None):
@@ -99,12 +101,15 @@ class SidTracker:
             sid_string = str(sid_object)
             
             # Initialize or update SID data
-            if sid_string not in self._sid_data:
+            # A single get() serves the common case of a SID seen before
+            sid_entry = self._sid_data.get(sid_string)
+            if sid_entry is None:
                 self._resolve_sid_info(sid_string, sid_object)
                 self.unique_sids_found += 1
+                sid_entry = self._sid_data[sid_string]
             
             # Increment file count for this SID
-            self._sid_data[sid_string]['file_count'] += 1
+            sid_entry['file_count'] += 1
             self.total_files_tracked += 1
             
         except Exception as e:
@@ -127,12 +132,15 @@ class SidTracker:
             sid_string = str(sid_object)
             
             # Initialize or update SID data
-            if sid_string not in self._sid_data:
+            # A single get() serves the common case of a SID seen before
+            sid_entry = self._sid_data.get(sid_string)
+            if sid_entry is None:
                 self._resolve_sid_info(sid_string, sid_object)
                 self.unique_sids_found += 1
+                sid_entry = self._sid_data[sid_string]
             
             # Increment directory count for this SID
-            self._sid_data[sid_string]['dir_count'] += 1
+            sid_entry['dir_count'] += 1
             self.total_dirs_tracked += 1
             
         except Exception as e:
@@ -606,6 +614,7 @@ class SidTracker:
             yaml_data = self._prepare_yaml_remediation_data(orphaned_sids)
             
             # Write YAML file
+            import yaml
             with open(filename, 'w', encoding='utf-8') as f:
                 yaml.dump(yaml_data, f, default_flow_style=False, allow_unicode=True, sort_keys=False)
             
@@ -9,6 +9,7 @@ and execution timing.
 Key Features:
 - Track directories and files traversed during processing
 - Count ownership changes made to directories and files
+- Count subtrees skipped by --skip-clean-subtrees
 - Monitor exceptions encountered during execution
 - Measure total execution time with high precision
 - Generate formatted reports with colored output
@@ -25,13 +26,15 @@ from typing import Optional
 try:
     from .common import (
         section_clr, reset_clr, COLORAMA_AVAILABLE, SECTION_BAR_WIDTH,
-        get_current_timestamp, format_elapsed_time, print_section_bar
+        get_current_timestamp, get_current_timestamp_ns, format_elapsed_time_ns,
+        print_section_bar
     )
 except ImportError:
     # Fall back to absolute imports (when run as a script)
     from common import (
         section_clr, reset_clr, COLORAMA_AVAILABLE, SECTION_BAR_WIDTH,
-        get_current_timestamp, format_elapsed_time, print_section_bar
+        get_current_timestamp, get_current_timestamp_ns, format_elapsed_time_ns,
+        print_section_bar
     )
 
 
@@ -43,6 +46,12 @@ class StatsTracker:
     along with methods to increment each counter and generate formatted reports.
     The tracker automatically records the start time when initialized and can
     calculate elapsed time for performance monitoring.
+    
+    All counters are updated on the walking thread: FileSystemWalker workers
+    defer their errors to it, so no counter needs a lock.
+    
+    Counters are updated per path so that the report stays exact when a walk
+    is interrupted or times out part-way through a directory.
     """
     
     def __init__(self):
@@ -51,8 +60,10 @@ class StatsTracker:
         self.files_traversed = 0
         self.dirs_changed = 0
         self.files_changed = 0
+        self.subtrees_skipped = 0
         self.exceptions = 0
         self.start_time = get_current_timestamp()
+        self._start_ns = get_current_timestamp_ns()
     
     def increment_dirs_traversed(self) -> None:
         """Increment the count of directories traversed."""
@@ -70,6 +81,15 @@ class StatsTracker:
         """Increment the count of file ownerships changed."""
         self.files_changed += 1
     
+    def increment_subtrees_skipped(self, count: int = 1) -> None:
+        """
+        Increment the count of subdirectories not entered (--skip-clean-subtrees).
+        
+        Args:
+            count: Number of subdirectories skipped
+        """
+        self.subtrees_skipped += count
+    
     def increment_exceptions(self) -> None:
         """Increment the count of exceptions encountered."""
         self.exceptions += 1
@@ -81,7 +101,8 @@ class StatsTracker:
         Returns:
             Elapsed time in seconds as a float with high precision
         """
-        return format_elapsed_time(self.start_time)
+        # Measured with the monotonic performance counter, not the wall clock
+        return format_elapsed_time_ns(self._start_ns)
     
     def print_report(self, quiet: bool = False, is_simulation: bool = False, output_manager=None) -> None:
         """
@@ -117,6 +138,8 @@ class StatsTracker:
             output_manager.print_info_pair("Files traversed", f"{self.files_traversed:,}")
             output_manager.print_info_pair("Directory ownerships changed", f"{self.dirs_changed:,}")
             output_manager.print_info_pair("File ownerships changed", f"{self.files_changed:,}")
+            if self.subtrees_skipped:
+                output_manager.print_info_pair("Clean subtrees skipped", f"{self.subtrees_skipped:,}")
             output_manager.print_info_pair("Exceptions encountered", f"{self.exceptions:,}")
             output_manager.print_info_pair("Total execution time", f"{elapsed_time:.2f} seconds")
         else:
@@ -125,6 +148,8 @@ class StatsTracker:
             print(f"Files traversed: {self.files_traversed:,}")
             print(f"Directory ownerships changed: {self.dirs_changed:,}")
             print(f"File ownerships changed: {self.files_changed:,}")
+            if self.subtrees_skipped:
+                print(f"Clean subtrees skipped: {self.subtrees_skipped:,}")
             print(f"Exceptions encountered: {self.exceptions:,}")
             print(f"Total execution time: {elapsed_time:.2f} seconds")
         
@@ -142,6 +167,7 @@ class StatsTracker:
             'files_traversed': self.files_traversed,
             'dirs_changed': self.dirs_changed,
             'files_changed': self.files_changed,
+            'subtrees_skipped': self.subtrees_skipped,
             'exceptions': self.exceptions,
             'elapsed_time': self.get_elapsed_time()
         }
@@ -157,8 +183,10 @@ class StatsTracker:
         self.files_traversed = 0
         self.dirs_changed = 0
         self.files_changed = 0
+        self.subtrees_skipped = 0
         self.exceptions = 0
         self.start_time = get_current_timestamp()
+        self._start_ns = get_current_timestamp_ns()
     
     def has_changes(self) -> bool:
         """
@@ -8,6 +8,7 @@ take an indefinite amount of time.
 
 Key Features:
 - Configurable timeout limits with 0 meaning no timeout
+- Monotonic deadline checks that are safe to call from worker threads
 - Thread-based timeout detection for non-blocking operation
 - Graceful termination that allows current operations to complete
 - Integration with filesystem processing for periodic timeout checks
@@ -33,6 +34,11 @@ class TimeoutManager:
     
     This class provides timeout checking mechanism that can interrupt processing
     and graceful termination when timeout is reached.
+    
+    Time is measured with the monotonic performance counter, and the deadline is
+    computed once, so each check is a single clock read and comparison. Once the
+    timeout has been reached, later checks return immediately without reading the
+    clock. No signals are used, so checks work from any thread.
     """
     
     def __init__(self, timeout_seconds: int = 0):
@@ -44,6 +50,7 @@ class TimeoutManager:
         """
         self.timeout_seconds = timeout_seconds
         self.start_time = self._get_current_time()
+        self._deadline = self.start_time + timeout_seconds
         self.timeout_reached = False
         self._timer: Optional[threading.Timer] = None
         
@@ -56,9 +63,12 @@ class TimeoutManager:
         """
         if self.timeout_seconds <= 0:
             return False
+        
+        # Once reached, the timeout stays reached - skip the clock read
+        if self.timeout_reached:
+            return True
             
-        elapsed = self._get_current_time() - self.start_time
-        if elapsed >= self.timeout_seconds:
+        if self._get_current_time() >= self._deadline:
             self.timeout_reached = True
             
         return self.timeout_reached
@@ -122,6 +132,7 @@ class TimeoutManager:
         Reset the timeout timer to start counting from now.
         """
         self.start_time = self._get_current_time()
+        self._deadline = self.start_time + self.timeout_seconds
         self.timeout_reached = False
         if self._timer:
             self._timer.cancel()
@@ -144,5 +155,10 @@ class TimeoutManager:
         self.cancel_timeout()
     
     def _get_current_time(self) -> float:
-        """Get current timestamp - can be overridden for testing."""
-        return time.time()
\ No newline at end of file
+        """
+        Get current monotonic timestamp - can be overridden for testing.
+        
+        time.perf_counter() is unaffected by system clock changes and, unlike
+        time.time() and time.monotonic(), has sub-millisecond resolution on Windows.
+        """
+        return time.perf_counter()
\ No newline at end of file
@@ -12,7 +12,7 @@ from unittest.mock import patch
 
 # Import the parse_arguments function from src/fix_owner.py
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
-from src.fix_owner import parse_arguments
+from src.fix_owner import parse_arguments, _build_parser
 
 
 class TestArgumentParsing(unittest.TestCase):
@@ -233,6 +233,19 @@ class TestArgumentParsing(unittest.TestCase):
             self.assertTrue(args.files)
             self.assertEqual(args.verbose, 1)
             self.assertEqual(args.timeout, 180)
+    
+    def test_explicit_argv_reuses_parser(self):
+        """Test parsing an explicit argument list twice with the shared parser."""
+        first = parse_arguments([self.test_dir, '-x'])
+        second = parse_arguments([self.test_dir, '-r', '-th', '4'])
+        
+        # Options from the first call do not leak into the second
+        self.assertTrue(first.execute)
+        self.assertFalse(first.recurse)
+        self.assertFalse(second.execute)
+        self.assertTrue(second.recurse)
+        self.assertEqual(second.threads, 4)
+        self.assertIs(_build_parser(), _build_parser())
 
 
 def run_argument_parsing_tests():
@@ -6,11 +6,14 @@ This module tests the shared utilities, constants, and helper functions
 in common.py to increase coverage of the foundational components.
 """
 
+import importlib
 import sys
 import os
 import unittest
 from unittest.mock import Mock, patch, MagicMock
 import time
+import tempfile
+import shutil
 
 # Add src directory to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
@@ -19,7 +22,8 @@ import common
 from common import (
     get_current_timestamp, format_elapsed_time, setup_module_path,
     print_section_header, print_section_bar, safe_exit,
-    validate_path_exists, validate_path_is_directory,
+    validate_path_exists, validate_path_is_directory, classify_path,
+    extended_length_path,
     try_import_with_fallback, COLORAMA_AVAILABLE, PYWIN32_AVAILABLE,
     EXIT_SUCCESS, EXIT_ERROR, EXIT_INTERRUPTED
 )
@@ -55,18 +59,26 @@ class TestTimestampUtilities(unittest.TestCase):
         
         self.assertIsInstance(elapsed, float)
         self.assertGreaterEqual(elapsed, 0)
+    
+    def test_format_elapsed_time_ns(self):
+        """Test monotonic elapsed time calculation."""
+        start_ns = common.get_current_timestamp_ns()
+        self.assertIsInstance(start_ns, int)
+        time.sleep(0.01)  # Small delay
+        elapsed = common.format_elapsed_time_ns(start_ns)
+        
+        self.assertIsInstance(elapsed, float)
+        self.assertGreaterEqual(elapsed, 0.01)
+        self.assertLess(elapsed, 1)  # Should be less than 1 second
 
 
 class TestModuleSetup(unittest.TestCase):
     """Test cases for module setup utilities."""
     
     @patch('common.sys.path')
-    @patch('common.os.path.dirname')
-    @patch('common.os.path.abspath')
-    def test_setup_module_path_new_path(self, mock_abspath, mock_dirname, mock_path):
+    @patch('common._MODULE_DIR', "/fake/directory")
+    def test_setup_module_path_new_path(self, mock_path):
         """Test adding new path to sys.path."""
-        mock_abspath.return_value = "/fake/absolute/path"
-        mock_dirname.return_value = "/fake/directory"
         mock_path.__contains__ = Mock(return_value=False)
         mock_path.insert = Mock()
         
@@ -75,12 +87,9 @@ class TestModuleSetup(unittest.TestCase):
         mock_path.insert.assert_called_once_with(0, "/fake/directory")
     
     @patch('common.sys.path')
-    @patch('common.os.path.dirname')
-    @patch('common.os.path.abspath')
-    def test_setup_module_path_existing_path(self, mock_abspath, mock_dirname, mock_path):
+    @patch('common._MODULE_DIR', "/fake/directory")
+    def test_setup_module_path_existing_path(self, mock_path):
         """Test not adding existing path to sys.path."""
-        mock_abspath.return_value = "/fake/absolute/path"
-        mock_dirname.return_value = "/fake/directory"
         mock_path.__contains__ = Mock(return_value=True)
         mock_path.insert = Mock()
         
@@ -224,6 +233,32 @@ class TestPathValidation(unittest.TestCase):
         
         self.assertFalse(result)
         mock_isdir.assert_called_once_with("/fake/file.txt")
+    
+    def test_classify_path(self):
+        """Test classifying missing paths, directories and files with one stat."""
+        test_dir = tempfile.mkdtemp()
+        try:
+            test_file = os.path.join(test_dir, "file.txt")
+            with open(test_file, 'w') as f:
+                f.write("test")
+            
+            self.assertEqual(classify_path(test_dir), 'dir')
+            self.assertEqual(classify_path(test_file), 'file')
+            self.assertEqual(classify_path(os.path.join(test_dir, "missing")), 'missing')
+            
+            with patch('common.os.stat', wraps=os.stat) as mock_stat:
+                classify_path(test_dir)
+                mock_stat.assert_called_once_with(test_dir)
+        finally:
+            shutil.rmtree(test_dir, ignore_errors=True)
+    
+    def test_extended_length_path(self):
+        """Test adding the extended-length prefix to drive, UNC and prefixed paths."""
+        self.assertEqual(extended_length_path("C:\\Data"), "\\\\?\\C:\\Data")
+        self.assertEqual(extended_length_path("\\\\server\\share\\dir"),
+                         "\\\\?\\UNC\\server\\share\\dir")
+        self.assertEqual(extended_length_path("\\\\?\\C:\\Data"), "\\\\?\\C:\\Data")
+        self.assertEqual(extended_length_path("\\\\.\\C:\\Data"), "\\\\.\\C:\\Data")
 
 
 class TestImportUtilities(unittest.TestCase):
@@ -236,28 +271,47 @@ class TestImportUtilities(unittest.TestCase):
         mock_module.test_attr1 = "value1"
         mock_module.test_attr2 = "value2"
         
-        with patch('builtins.__import__', return_value=mock_module) as mock_import:
+        with patch('importlib.import_module', return_value=mock_module) as mock_import:
             result = try_import_with_fallback('.test_module', 'test_module', ['test_attr1', 'test_attr2'])
             
             self.assertEqual(result, {'test_attr1': 'value1', 'test_attr2': 'value2'})
-            mock_import.assert_called_once_with('.test_module', fromlist=['test_attr1', 'test_attr2'], level=1)
+            mock_import.assert_called_once_with('.test_module', package=common.__package__ or None)
     
     def test_try_import_with_fallback_absolute_fallback(self):
         """Test fallback to absolute import when relative fails."""
         mock_module = Mock()
         mock_module.test_attr = "fallback_value"
         
-        def import_side_effect(name, fromlist=None, level=0):
-            if level == 1:  # Relative import
+        def import_side_effect(name, package=None):
+            if name.startswith('.'):  # Relative import
                 raise ImportError("Relative import failed")
             return mock_module
         
-        with patch('builtins.__import__', side_effect=import_side_effect) as mock_import:
+        with patch('importlib.import_module', side_effect=import_side_effect) as mock_import:
             result = try_import_with_fallback('.test_module', 'test_module', ['test_attr'])
             
             self.assertEqual(result, {'test_attr': 'fallback_value'})
             # Should be called twice: once for relative, once for absolute
             self.assertEqual(mock_import.call_count, 2)
+    
+    def test_try_import_with_fallback_memoized(self):
+        """Test that repeated imports are served from the cache."""
+        mock_module = Mock()
+        mock_module.cached_attr = "cached_value"
+        
+        with patch('importlib.import_module', return_value=mock_module) as mock_import:
+            first = try_import_with_fallback('.cached_module', 'cached_module', ['cached_attr'])
+            second = try_import_with_fallback('.cached_module', 'cached_module', ['cached_attr'])
+            
+            self.assertEqual(first, {'cached_attr': 'cached_value'})
+            self.assertEqual(second, first)
+            mock_import.assert_called_once()
+    
+    def test_try_import_with_fallback_outside_package(self):
+        """Test the real fallback when common is loaded as a top-level module."""
+        result = try_import_with_fallback('.common', 'common', ['EXIT_SUCCESS', 'EXIT_ERROR'])
+        
+        self.assertEqual(result, {'EXIT_SUCCESS': common.EXIT_SUCCESS, 'EXIT_ERROR': common.EXIT_ERROR})
 
 
 class TestConstants(unittest.TestCase):
@@ -273,6 +327,27 @@ class TestConstants(unittest.TestCase):
         """Test that COLORAMA_AVAILABLE flag is boolean."""
         self.assertIsInstance(COLORAMA_AVAILABLE, bool)
     
+    def test_colors_disabled_when_not_a_terminal(self):
+        """Test that redirected output (as under the test runner) gets no escape codes."""
+        if not sys.stdout.isatty():
+            self.assertFalse(common.COLORS_ENABLED)
+            self.assertEqual(common.reset_clr, "")
+        
+        # Enabling console colors is always safe to call repeatedly
+        common.enable_console_colors()
+        common.enable_console_colors()
+    
+    def test_colors_disabled_by_no_color(self):
+        """Test that NO_COLOR disables colors even on a terminal."""
+        try:
+            with patch.dict(os.environ, {'NO_COLOR': '1'}), patch('sys.stdout') as mock_stdout:
+                mock_stdout.isatty.return_value = True
+                importlib.reload(common)
+                self.assertFalse(common.COLORS_ENABLED)
+                self.assertEqual(common.section_clr, "")
+        finally:
+            importlib.reload(common)
+    
     def test_pywin32_availability_flag(self):
         """Test that PYWIN32_AVAILABLE flag is boolean."""
         self.assertIsInstance(PYWIN32_AVAILABLE, bool)
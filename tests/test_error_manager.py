@@ -43,9 +43,34 @@ def test_error_categorization():
     category = error_manager._categorize_exception(critical_error, None, "test context")
     assert category == ErrorCategory.CRITICAL, f"Expected CRITICAL, got {category}"
     
+    # Log labels keep the lowercase category names
+    assert ErrorCategory.SECURITY.label == "security"
+    assert ErrorCategory.CONFIGURATION.label == "configuration"
+    
+    # Critical types win over message keywords
+    critical_error = MemoryError("security descriptor allocation failed")
+    category = error_manager._categorize_exception(critical_error, None, "test context")
+    assert category == ErrorCategory.CRITICAL, f"Expected CRITICAL, got {category}"
+    
     print("✓ Error categorization test passed")
 
 
+def test_error_category_values():
+    """Test that every error category is truthy and logs under its lowercase name."""
+    print("Testing error category values...")
+    
+    # No category is 0, so "if category:" never mistakes one for a missing category
+    assert all(ErrorCategory), "Every ErrorCategory member should be truthy"
+    assert min(ErrorCategory) == 1, f"Expected numbering from 1, got {min(ErrorCategory)}"
+    
+    # Logs show the label (the former string value), not the integer
+    assert [category.label for category in ErrorCategory] == [
+        "security", "filesystem", "configuration", "timeout", "privilege", "critical"
+    ]
+    
+    print("✓ Error category values test passed")
+
+
 def test_error_message_formatting():
     """Test that error messages are properly formatted."""
     print("Testing error message formatting...")
@@ -122,7 +147,14 @@ def test_administrator_privilege_validation():
         assert result == False, "Should return False when not admin"
         mock_output.print_warning.assert_called_with("Warning: Administrator privileges required for ownership changes - Limited functionality without proper privileges")
     
+    # The result is cached per ErrorManager, so a repeated check does not call the API again
+    with patch('ctypes.windll.shell32.IsUserAnAdmin', return_value=True) as mock_is_admin:
+        result = error_manager.validate_administrator_privileges()
+        assert result == False, "Cached result should be reused"
+        mock_is_admin.assert_not_called()
+    
     # Test with mock that returns True (is admin)
+    error_manager = ErrorManager(output_manager=mock_output)
     with patch('ctypes.windll.shell32.IsUserAnAdmin', return_value=True):
         result = error_manager.validate_administrator_privileges()
         assert result == True, "Should return True when admin"
@@ -235,6 +267,31 @@ def test_common_error_solutions():
     print("✓ Common error solutions test passed")
 
 
+def test_handled_exception_traceback_released():
+    """Test that handled exceptions drop their traceback unless output is verbose."""
+    print("Testing traceback release for handled exceptions...")
+    
+    def raise_and_handle(error_manager):
+        try:
+            raise OSError("File in use")
+        except OSError as e:
+            error_manager.handle_exception(e, "/test/path", "Test context")
+            return e
+    
+    # Non-verbose: traceback is released
+    mock_output = Mock()
+    mock_output.get_verbose_level = Mock(return_value=0)
+    handled = raise_and_handle(ErrorManager(output_manager=mock_output))
+    assert handled.__traceback__ is None, "Traceback should be released"
+    
+    # Verbose: traceback is kept for debugging
+    mock_output.get_verbose_level = Mock(return_value=1)
+    handled = raise_and_handle(ErrorManager(output_manager=mock_output))
+    assert handled.__traceback__ is not None, "Traceback should be kept in verbose mode"
+    
+    print("✓ Traceback release test passed")
+
+
 def test_critical_error_handling():
     """Test that critical errors are handled properly."""
     print("Testing critical error handling...")
@@ -269,12 +326,14 @@ def run_all_tests():
     
     try:
         test_error_categorization()
+        test_error_category_values()
         test_error_message_formatting()
         test_exception_handling_with_stats()
         test_administrator_privilege_validation()
         test_exception_context_manager()
         test_error_handler_integration()
         test_common_error_solutions()
+        test_handled_exception_traceback_released()
         test_critical_error_handling()
         
         print("\n✅ All ErrorManager tests passed!")
@@ -24,7 +24,7 @@ from io import StringIO
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 # Import the modules to test
-from filesystem_walker import FileSystemWalker
+from filesystem_walker import FileSystemWalker, FailureRecord
 from error_manager import ErrorManager
 from stats_tracker import StatsTracker
 from security_manager import SecurityManager
@@ -73,9 +73,9 @@ class TestFailedFilesLogging(unittest.TestCase):
         
         # Verify the failure was collected
         self.assertEqual(len(walker.failed_directories), 1)
-        self.assertEqual(walker.failed_directories[0]['path'], "/test/dir")
-        self.assertEqual(walker.failed_directories[0]['error'], "Test error")
-        self.assertEqual(walker.failed_directories[0]['exception_type'], "Exception")
+        self.assertEqual(walker.failed_directories[0].path, "/test/dir")
+        self.assertEqual(walker.failed_directories[0].error, "Test error")
+        self.assertEqual(walker.failed_directories[0].exception_type, "Exception")
     
     def test_failed_file_collection_without_error_manager(self):
         """Test failed file collection when ErrorManager is not available."""
@@ -98,9 +98,9 @@ class TestFailedFilesLogging(unittest.TestCase):
         
         # Verify the failure was collected
         self.assertEqual(len(walker.failed_files), 1)
-        self.assertEqual(walker.failed_files[0]['path'], "/test/file.txt")
-        self.assertEqual(walker.failed_files[0]['error'], "File error")
-        self.assertEqual(walker.failed_files[0]['exception_type'], "Exception")
+        self.assertEqual(walker.failed_files[0].path, "/test/file.txt")
+        self.assertEqual(walker.failed_files[0].error, "File error")
+        self.assertEqual(walker.failed_files[0].exception_type, "Exception")
     
     def test_failed_directory_collection_with_error_manager(self):
         """Test failed directory collection when ErrorManager is available."""
@@ -125,9 +125,9 @@ class TestFailedFilesLogging(unittest.TestCase):
         
         # Verify the failure was collected
         self.assertEqual(len(self.walker.failed_directories), 1)
-        self.assertEqual(self.walker.failed_directories[0]['path'], "/test/context_dir")
-        self.assertEqual(self.walker.failed_directories[0]['error'], "Context error")
-        self.assertEqual(self.walker.failed_directories[0]['exception_type'], "Exception")
+        self.assertEqual(self.walker.failed_directories[0].path, "/test/context_dir")
+        self.assertEqual(self.walker.failed_directories[0].error, "Context error")
+        self.assertEqual(self.walker.failed_directories[0].exception_type, "Exception")
     
     def test_failed_file_collection_with_error_manager(self):
         """Test failed file collection when ErrorManager is available."""
@@ -152,9 +152,9 @@ class TestFailedFilesLogging(unittest.TestCase):
         
         # Verify the failure was collected
         self.assertEqual(len(self.walker.failed_files), 1)
-        self.assertEqual(self.walker.failed_files[0]['path'], "/test/context_file.txt")
-        self.assertEqual(self.walker.failed_files[0]['error'], "File context error")
-        self.assertEqual(self.walker.failed_files[0]['exception_type'], "Exception")
+        self.assertEqual(self.walker.failed_files[0].path, "/test/context_file.txt")
+        self.assertEqual(self.walker.failed_files[0].error, "File context error")
+        self.assertEqual(self.walker.failed_files[0].exception_type, "Exception")
     
     def test_write_failed_files_log_no_failures(self):
         """Test write_failed_files_log when there are no failures."""
@@ -174,11 +174,7 @@ class TestFailedFilesLogging(unittest.TestCase):
         )
         
         # Add some failures
-        walker.failed_files.append({
-            'path': '/test/file.txt',
-            'error': 'Test error',
-            'exception_type': 'Exception'
-        })
+        walker.failed_files.append(FailureRecord('/test/file.txt', 'Test error', 'Exception'))
         
         # Should not crash when no error manager
         walker.write_failed_files_log()
@@ -186,21 +182,9 @@ class TestFailedFilesLogging(unittest.TestCase):
     def test_write_failed_files_log_with_failures(self):
         """Test write_failed_files_log with both file and directory failures."""
         # Add some failures
-        self.walker.failed_files.append({
-            'path': '/test/file1.txt',
-            'error': 'Access denied',
-            'exception_type': 'PermissionError'
-        })
-        self.walker.failed_files.append({
-            'path': '/test/file2.txt',
-            'error': 'File not found',
-            'exception_type': 'FileNotFoundError'
-        })
-        self.walker.failed_directories.append({
-            'path': '/test/dir1',
-            'error': 'Access denied',
-            'exception_type': 'PermissionError'
-        })
+        self.walker.failed_files.append(FailureRecord('/test/file1.txt', 'Access denied', 'PermissionError'))
+        self.walker.failed_files.append(FailureRecord('/test/file2.txt', 'File not found', 'FileNotFoundError'))
+        self.walker.failed_directories.append(FailureRecord('/test/dir1', 'Access denied', 'PermissionError'))
         
         # Call the method
         self.walker.write_failed_files_log()
@@ -233,21 +217,9 @@ class TestFailedFilesLogging(unittest.TestCase):
     def test_failure_sorting(self):
         """Test that failures are sorted by path."""
         # Add failures in non-alphabetical order
-        self.walker.failed_files.append({
-            'path': '/test/z_file.txt',
-            'error': 'Error Z',
-            'exception_type': 'Exception'
-        })
-        self.walker.failed_files.append({
-            'path': '/test/a_file.txt',
-            'error': 'Error A',
-            'exception_type': 'Exception'
-        })
-        self.walker.failed_directories.append({
-            'path': '/test/m_dir',
-            'error': 'Error M',
-            'exception_type': 'Exception'
-        })
+        self.walker.failed_files.append(FailureRecord('/test/z_file.txt', 'Error Z', 'Exception'))
+        self.walker.failed_files.append(FailureRecord('/test/a_file.txt', 'Error A', 'Exception'))
+        self.walker.failed_directories.append(FailureRecord('/test/m_dir', 'Error M', 'Exception'))
         
         # Call the method
         self.walker.write_failed_files_log()
@@ -264,11 +236,7 @@ class TestFailedFilesLogging(unittest.TestCase):
     def test_failure_format(self):
         """Test the format of individual failure entries."""
         # Add a failure
-        self.walker.failed_files.append({
-            'path': '/test/sample.txt',
-            'error': 'Sample error message',
-            'exception_type': 'SampleException'
-        })
+        self.walker.failed_files.append(FailureRecord('/test/sample.txt', 'Sample error message', 'SampleException'))
         
         # Call the method
         self.walker.write_failed_files_log()
@@ -305,6 +273,7 @@ class TestFailedFilesIntegration(unittest.TestCase):
         mock_options.files = True
         mock_options.execute = False
         mock_options.timeout = 0
+        mock_options.threads = 1
         
         mock_owner_sid = Mock()
         mock_stats = Mock()
@@ -327,7 +296,8 @@ class TestFailedFilesIntegration(unittest.TestCase):
         
         # Verify that the walker was created with the error manager
         mock_walker_class.assert_called_once_with(
-            mock_security_manager, mock_stats, mock_error_manager, None
+            mock_security_manager, mock_stats, mock_error_manager, None,
+            max_workers=1
         )
         
         # Verify that walk_filesystem was called
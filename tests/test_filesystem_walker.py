@@ -86,7 +86,8 @@ class TestFileSystemWalker(unittest.TestCase):
         
         # Should have called get_current_owner for root directory only
         self.assertEqual(self.mock_security_manager.get_current_owner.call_count, 1)
-        self.mock_security_manager.get_current_owner.assert_called_with(self.test_dir)
+        self.mock_security_manager.get_current_owner.assert_called_with(
+            self.test_dir, api_path=self.test_dir, report_errors=True)
     
     def test_walk_filesystem_with_recursion(self):
         """Test filesystem walk with recursion enabled."""
@@ -151,8 +152,11 @@ class TestFileSystemWalker(unittest.TestCase):
         )
         
         # Should have attempted to set owner
-        self.mock_security_manager.set_owner.assert_called_with(self.test_dir, mock_owner_sid)
+        self.mock_security_manager.set_owner.assert_called_with(
+            self.test_dir, mock_owner_sid, "invalid_sid", api_path=self.test_dir, report_errors=True)
         self.mock_stats_tracker.increment_dirs_changed.assert_called()
+        # Validity comes from the owner lookup, without a second SID resolution
+        self.mock_security_manager.is_sid_valid.assert_not_called()
     
     def test_walk_filesystem_dry_run_mode(self):
         """Test filesystem walk in dry run mode."""
@@ -250,7 +254,7 @@ class TestFileSystemWalker(unittest.TestCase):
     def test_walk_filesystem_mixed_valid_invalid_sids(self):
         """Test filesystem walk with mix of valid and invalid SIDs."""
         # Mock security manager to return different results for different paths
-        def mock_get_owner(path):
+        def mock_get_owner(path, api_path=None, report_errors=True):
             if "subdir" in path:
                 return (None, "invalid_sid")  # Invalid SID
             else:
@@ -339,7 +343,8 @@ class TestFileSystemWalker(unittest.TestCase):
         )
         
         # Verify ownership change was attempted
-        self.mock_security_manager.set_owner.assert_called_with(self.test_dir, mock_owner_sid)
+        self.mock_security_manager.set_owner.assert_called_with(
+            self.test_dir, mock_owner_sid, "invalid_sid", api_path=self.test_dir, report_errors=True)
         self.mock_stats_tracker.increment_dirs_changed.assert_called()
         mock_output_manager.print_ownership_change.assert_called()
     
@@ -358,7 +363,8 @@ class TestFileSystemWalker(unittest.TestCase):
         )
         
         # Verify ownership change was attempted
-        self.mock_security_manager.set_owner.assert_called_with(self.test_file1, mock_owner_sid)
+        self.mock_security_manager.set_owner.assert_called_with(
+            self.test_file1, mock_owner_sid, "invalid_sid", api_path=self.test_file1, report_errors=True)
         self.mock_stats_tracker.increment_files_changed.assert_called()
         mock_output_manager.print_ownership_change.assert_called()
     
@@ -389,6 +395,359 @@ class TestFileSystemWalker(unittest.TestCase):
         # Should have printed timeout warning
         mock_output_manager.print_timeout_warning.assert_called()
     
+    def test_walk_filesystem_with_thread_pool(self):
+        """Test that parallel processing produces the same counts as serial processing."""
+        walker_parallel = FileSystemWalker(
+            self.mock_security_manager,
+            self.mock_stats_tracker,
+            self.mock_error_manager,
+            max_workers=4
+        )
+        
+        # Mock security manager responses - invalid SID
+        self.mock_security_manager.get_current_owner.return_value = (None, "invalid_sid")
+        self.mock_security_manager.is_sid_valid.return_value = False
+        
+        mock_owner_sid = Mock()
+        mock_output_manager = Mock()
+        
+        walker_parallel.walk_filesystem(
+            root_path=self.test_dir,
+            owner_sid=mock_owner_sid,
+            recurse=True,
+            process_files=True,
+            execute=True,
+            output_manager=mock_output_manager
+        )
+        
+        # All directories and files processed and changed
+        self.assertEqual(self.mock_stats_tracker.increment_dirs_traversed.call_count, 3)
+        self.assertEqual(self.mock_stats_tracker.increment_files_traversed.call_count, 3)
+        self.assertEqual(self.mock_stats_tracker.increment_dirs_changed.call_count, 3)
+        self.assertEqual(self.mock_stats_tracker.increment_files_changed.call_count, 3)
+        self.assertEqual(self.mock_security_manager.set_owner.call_count, 6)
+        
+        # Output stays in walk order: root directory is entered first
+        first_entered = mock_output_manager.print_entering_directory.call_args_list[0]
+        self.assertEqual(first_entered[0][0], self.test_dir)
+    
+    @patch('src.filesystem_walker.CHUNK_SIZE', 2)
+    def test_walk_filesystem_thread_pool_file_batches(self):
+        """Test that large directories are split into file batches across workers."""
+        walker_parallel = FileSystemWalker(
+            self.mock_security_manager,
+            self.mock_stats_tracker,
+            self.mock_error_manager,
+            max_workers=3
+        )
+        
+        # Add more files to the root directory so it spans several batches
+        for index in range(5):
+            with open(os.path.join(self.test_dir, f"extra{index}.txt"), 'w') as f:
+                f.write("test content")
+        
+        self.mock_security_manager.get_current_owner.return_value = (None, "invalid_sid")
+        self.mock_security_manager.is_sid_valid.return_value = False
+        
+        mock_output_manager = Mock()
+        
+        walker_parallel.walk_filesystem(
+            root_path=self.test_dir,
+            owner_sid=Mock(),
+            recurse=False,
+            process_files=True,
+            execute=False,
+            output_manager=mock_output_manager
+        )
+        
+        # Directory once, every file once, in directory listing order
+        self.assertEqual(self.mock_stats_tracker.increment_dirs_traversed.call_count, 1)
+        self.assertEqual(self.mock_stats_tracker.increment_files_changed.call_count, 6)
+        examined = [c[0][0] for c in mock_output_manager.print_examining_path.call_args_list]
+        self.assertEqual(examined[0], self.test_dir)
+        self.assertEqual(sorted(examined[1:]), sorted(
+            os.path.join(self.test_dir, name) for name in os.listdir(self.test_dir)
+            if os.path.isfile(os.path.join(self.test_dir, name))
+        ))
+    
+    def test_walk_filesystem_thread_pool_exception_handling(self):
+        """Test that worker-thread errors are reported on the walking thread."""
+        walker_parallel = FileSystemWalker(
+            self.mock_security_manager,
+            self.mock_stats_tracker,
+            error_manager=None,
+            max_workers=2
+        )
+        
+        # Mock security manager to raise exception
+        self.mock_security_manager.get_current_owner.side_effect = Exception("Test exception")
+        
+        mock_output_manager = Mock()
+        
+        walker_parallel.walk_filesystem(
+            root_path=self.test_dir,
+            owner_sid=Mock(),
+            recurse=True,
+            process_files=False,
+            execute=False,
+            output_manager=mock_output_manager
+        )
+        
+        # Every directory failure is counted and collected
+        self.assertEqual(self.mock_stats_tracker.increment_exceptions.call_count, 3)
+        self.assertEqual(len(walker_parallel.failed_directories), 3)
+        self.assertEqual(mock_output_manager.print_error.call_count, 3)
+    
+    def test_walk_filesystem_thread_pool_error_manager_on_walking_thread(self):
+        """Test that worker threads leave ErrorManager reporting to the walking thread."""
+        import threading
+        
+        walker_parallel = FileSystemWalker(
+            self.mock_security_manager,
+            self.mock_stats_tracker,
+            error_manager=None,
+            max_workers=2
+        )
+        
+        cause = OSError("Access denied")
+        wrapped = Exception("Failed to get owner information")
+        wrapped.__cause__ = cause
+        self.mock_security_manager.get_current_owner.side_effect = wrapped
+        
+        reporting_threads = []
+        self.mock_security_manager.report_error.side_effect = (
+            lambda *args: reporting_threads.append(threading.current_thread())
+        )
+        
+        walker_parallel.walk_filesystem(
+            root_path=self.test_dir,
+            owner_sid=Mock(),
+            recurse=True,
+            process_files=False,
+            execute=False
+        )
+        
+        # Workers asked SecurityManager not to report; the walking thread reported instead
+        for owner_call in self.mock_security_manager.get_current_owner.call_args_list:
+            self.assertFalse(owner_call.kwargs['report_errors'])
+        self.assertEqual(reporting_threads, [threading.current_thread()] * 3)
+        self.mock_security_manager.report_error.assert_called_with(
+            cause, self.deep_dir, "Getting current owner")
+    
+    def test_walk_filesystem_skip_clean_subtrees(self):
+        """Test that subtrees already owned by the target owner are not entered."""
+        target_sid = "target_sid"
+        
+        def get_owner(path, api_path=None, report_errors=True):
+            # The subdirectory belongs to the target; everything else is orphaned
+            if path == self.sub_dir:
+                return "TargetUser", target_sid
+            return None, "orphaned_sid"
+        
+        self.mock_security_manager.get_current_owner.side_effect = get_owner
+        
+        # A linked subdirectory is never entered, so skipping it is not counted
+        os.symlink(self.deep_dir, os.path.join(self.sub_dir, "link"),
+                   target_is_directory=True)
+        
+        for max_workers in (1, 4):
+            with self.subTest(max_workers=max_workers):
+                self.mock_security_manager.get_current_owner.reset_mock()
+                self.mock_stats_tracker.reset_mock()
+                walker = FileSystemWalker(
+                    self.mock_security_manager,
+                    self.mock_stats_tracker,
+                    self.mock_error_manager,
+                    max_workers=max_workers
+                )
+                walker.walk_filesystem(
+                    root_path=self.test_dir,
+                    owner_sid=target_sid,
+                    recurse=True,
+                    process_files=True,
+                    execute=False,
+                    skip_clean_subtrees=True
+                )
+                
+                # The clean directory and its files are examined, its subdirectory is not
+                examined = [c[0][0] for c in
+                            self.mock_security_manager.get_current_owner.call_args_list]
+                self.assertIn(self.sub_dir, examined)
+                self.assertIn(self.test_file2, examined)
+                self.assertNotIn(self.deep_dir, examined)
+                self.assertNotIn(self.test_file3, examined)
+                
+                # The one subdirectory left unvisited is reported in the statistics
+                self.mock_stats_tracker.increment_subtrees_skipped.assert_called_once_with(1)
+    
+    def test_walk_filesystem_skip_clean_subtrees_waits_on_directory_only(self):
+        """Test that pruning in parallel mode waits on a future that examines no files."""
+        self.mock_security_manager.get_current_owner.return_value = (None, "orphaned_sid")
+        walker = FileSystemWalker(self.mock_security_manager, self.mock_stats_tracker,
+                                  max_workers=4)
+        
+        with patch.object(walker, '_examine_directory',
+                          wraps=walker._examine_directory) as mock_examine:
+            walker.walk_filesystem(root_path=self.test_dir, owner_sid="target_sid",
+                                   recurse=True, process_files=True,
+                                   skip_clean_subtrees=True)
+        
+        # The root has a subdirectory, so it is examined on its own and its
+        # file batch no longer includes the directory
+        dir_call, file_call = [c[0] for c in mock_examine.call_args_list
+                               if c[0][0] == self.test_dir]
+        self.assertEqual(dir_call[1], [])
+        self.assertEqual(len(dir_call), 5)  # include_directory keeps its default of True
+        self.assertEqual(file_call[1], [os.path.basename(self.test_file1)])
+        self.assertFalse(file_call[5])
+    
+    def test_walk_filesystem_progress_skips_linked_directories(self):
+        """Test that the top-level progress total only counts directories that are walked."""
+        try:
+            os.symlink(self.sub_dir, os.path.join(self.test_dir, "linked"),
+                       target_is_directory=True)
+        except (OSError, NotImplementedError):
+            self.skipTest("Symbolic links are not supported here")
+        
+        self.mock_security_manager.get_current_owner.return_value = ("ValidUser", "valid_sid")
+        mock_output_manager = Mock()
+        mock_output_manager.is_level_1.return_value = True
+        
+        self.walker.walk_filesystem(
+            root_path=self.test_dir,
+            owner_sid=Mock(),
+            recurse=True,
+            output_manager=mock_output_manager
+        )
+        
+        progress = [
+            entered.kwargs['progress']
+            for entered in mock_output_manager.print_entering_directory.call_args_list
+            if entered.kwargs['progress'] is not None
+        ]
+        self.assertEqual(progress, [(1, 1)])
+    
+    def test_walk_scandir_matches_os_walk(self):
+        """Test that the scandir-based walk yields the same tuples as os.walk()."""
+        walked = list(self.walker._walk_scandir(self.test_dir))
+        
+        self.assertEqual([step[:3] for step in walked], list(os.walk(self.test_dir)))
+        # Depth counts levels below the root
+        self.assertEqual([step[3] for step in walked], [0, 1, 2])
+        self.assertEqual([step[4] for step in walked], [set(), set(), set()])
+    
+    def test_walk_scandir_trailing_separator(self):
+        """Test that subdirectory paths match os.walk() when the root ends with a separator."""
+        root = self.test_dir + os.sep
+        self.assertEqual(
+            [step[:3] for step in self.walker._walk_scandir(root)],
+            list(os.walk(root))
+        )
+    
+    def test_walk_scandir_skips_junctions(self):
+        """Test that directory junctions are listed but not descended into."""
+        def make_entry(name, is_junction):
+            entry = Mock()
+            entry.name = name
+            entry.is_dir.return_value = True
+            entry.is_symlink.return_value = False
+            entry.is_junction.return_value = is_junction
+            return entry
+        
+        def make_listing(entries):
+            listing = MagicMock()
+            listing.__enter__.return_value = entries
+            return listing
+        
+        listings = [
+            make_listing([make_entry("real", False), make_entry("junction", True)]),
+            make_listing([])
+        ]
+        with patch('src.filesystem_walker._IS_WINDOWS', True), \
+             patch('src.filesystem_walker.os.scandir', side_effect=listings):
+            walked = list(self.walker._walk_scandir("root"))
+        
+        self.assertEqual(walked[0], ("root", ["real", "junction"], [], 0, {"junction"}))
+        self.assertEqual([step[0] for step in walked],
+                         ["root", os.path.join("root", "real")])
+    
+    def test_walk_filesystem_extended_length_root(self):
+        """Test that only the OS and security calls see the extended-length form on Windows."""
+        # A directory of files only: DirEntry.is_junction() needs Python 3.12 off Windows
+        flat_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, flat_dir, ignore_errors=True)
+        with open(os.path.join(flat_dir, "file.txt"), 'w') as f:
+            f.write("test content")
+        
+        root = os.path.relpath(flat_dir)
+        file_path = os.path.join(root, "file.txt")
+        self.mock_security_manager.get_current_owner.side_effect = Exception("Access denied")
+        mock_output_manager = Mock()
+        
+        # Stand-in for the \\?\ prefix that still resolves on this platform
+        with patch('src.filesystem_walker._IS_WINDOWS', True), \
+             patch('src.filesystem_walker.extended_length_path', side_effect=lambda p: p), \
+             patch('src.filesystem_walker.os.scandir', wraps=os.scandir) as mock_scandir:
+            walker = FileSystemWalker(self.mock_security_manager, self.mock_stats_tracker)
+            walker.walk_filesystem(root_path=root, owner_sid=Mock(), recurse=True,
+                                   process_files=True, output_manager=mock_output_manager)
+        
+        # The OS and security calls receive the absolute form of each path
+        mock_scandir.assert_called_with(flat_dir)
+        self.mock_security_manager.get_current_owner.assert_called_with(
+            file_path, api_path=os.path.join(flat_dir, "file.txt"), report_errors=True)
+        
+        # Printed and logged paths keep the root as it was given
+        self.assertEqual(mock_output_manager.print_entering_directory.call_args[0][0], root)
+        printed = [c[0][0] for c in mock_output_manager.print_error.call_args_list]
+        self.assertEqual(printed, [root, file_path])
+        self.assertEqual([failure.path for failure in walker.failed_directories], [root])
+        self.assertEqual([failure.path for failure in walker.failed_files], [file_path])
+    
+    def test_walk_scandir_pruning(self):
+        """Test that clearing dirnames stops descent like os.walk()."""
+        visited = []
+        for dirpath, dirnames, filenames, depth, _ in self.walker._walk_scandir(self.test_dir):
+            visited.append(dirpath)
+            dirnames.clear()
+        
+        self.assertEqual(visited, [self.test_dir])
+    
+    def test_walk_scandir_no_recurse(self):
+        """Test that recurse=False yields only the root directory."""
+        walked = list(self.walker._walk_scandir(self.test_dir, recurse=False))
+        
+        self.assertEqual(walked, [next(os.walk(self.test_dir)) + (0, set())])
+    
+    @patch('src.filesystem_walker.TIMEOUT_CHECK_INTERVAL', 2)
+    def test_examine_directory_timeout_check_interval(self):
+        """Test that the timeout is checked on the first file and then every interval."""
+        self.walker._examine_path = Mock(side_effect=lambda path, sid, execute, report_errors: path)
+        mock_timeout_manager = Mock()
+        mock_timeout_manager.is_timeout_reached.return_value = False
+        
+        _, file_results, completed = self.walker._examine_directory(
+            self.test_dir, ["a", "b", "c", "d", "e"], "owner_sid", False,
+            mock_timeout_manager, include_directory=False
+        )
+        
+        self.assertTrue(completed)
+        self.assertEqual(len(file_results), 5)
+        # Files at index 0, 2 and 4 are checked
+        self.assertEqual(mock_timeout_manager.is_timeout_reached.call_count, 3)
+    
+    def test_examine_directory_file_paths(self):
+        """Test that file paths match os.path.join() with and without a trailing separator."""
+        self.walker._examine_path = Mock(side_effect=lambda path, sid, execute, report_errors: path)
+        
+        for dir_path in [self.test_dir, self.test_dir + os.sep]:
+            _, file_results, completed = self.walker._examine_directory(
+                dir_path, ["file1.txt"], "owner_sid", False, None, include_directory=False
+            )
+            
+            self.assertTrue(completed)
+            self.assertEqual(file_results, [os.path.join(dir_path, "file1.txt")])
+    
     def test_walker_without_error_manager(self):
         """Test FileSystemWalker without ErrorManager (fallback behavior)."""
         # Create walker without error manager
@@ -431,7 +431,7 @@ class TestIntegrationWorkflow(unittest.TestCase):
         structure = self.dir_structure.create_simple_structure()
         
         # Mock mixed ownership scenarios
-        def mock_get_owner(path):
+        def mock_get_owner(path, api_path=None, report_errors=True):
             if 'subdir1' in path:
                 return (None, "invalid_sid")  # Invalid SID
             else:
@@ -469,7 +469,7 @@ class TestIntegrationWorkflow(unittest.TestCase):
         structure = self.dir_structure.create_simple_structure()
         
         # Mock security manager to raise exceptions for some paths
-        def mock_get_owner_with_errors(path):
+        def mock_get_owner_with_errors(path, api_path=None, report_errors=True):
             if 'subdir2' in path:
                 raise PermissionError("Access denied")
             return ("ValidUser", "valid_sid")
@@ -850,7 +850,7 @@ class TestEndToEndScenarios(unittest.TestCase):
         mock_error_manager = Mock()
         
         # Setup error scenarios
-        def mock_get_owner_with_intermittent_errors(path):
+        def mock_get_owner_with_intermittent_errors(path, api_path=None, report_errors=True):
             if 'file2' in path:
                 raise PermissionError("Access denied")
             elif 'nested' in path:
@@ -899,7 +899,7 @@ class TestEndToEndScenarios(unittest.TestCase):
         mock_error_manager = Mock()
         
         # Setup mixed ownership scenario
-        def mock_mixed_ownership(path):
+        def mock_mixed_ownership(path, api_path=None, report_errors=True):
             if 'level_1' in path or 'level_2' in path:
                 return (None, "invalid_sid")  # Invalid SID
             else:
@@ -185,6 +185,24 @@ class TestErrorManagerOutputDirectory(unittest.TestCase):
         self.assertTrue(success)
         self.assertTrue(os.path.exists("output"))
         self.assertTrue(os.path.exists(filename))
+    
+    def test_log_operation_failures_writes_all_failures(self):
+        """Test that every failure is numbered and written in order."""
+        failures = [f"File: /test/file{i}.txt" for i in range(3)]
+        
+        self.error_manager.log_operation_failures("test_batch", failures, summary="Batch summary")
+        
+        filename = self.error_manager.create_failure_log_filename("test_batch_failures")
+        with open(filename, 'r', encoding='utf-8') as f:
+            written_content = f.read()
+        
+        self.assertIn("=== TEST_BATCH FAILURES LOG ===", written_content)
+        self.assertIn("Total Failures: 3", written_content)
+        self.assertIn("Batch summary", written_content)
+        positions = [written_content.index(f"Failure #{i + 1}: {failure}")
+                     for i, failure in enumerate(failures)]
+        self.assertEqual(positions, sorted(positions))
+        self.assertTrue(written_content.rstrip().endswith("=== END TEST_BATCH FAILURES LOG ==="))
 
 
 class TestSidTrackerOutputDirectory(unittest.TestCase):
@@ -181,6 +181,95 @@ def test_quiet_stats_reporter():
     print("✓ Quiet StatsReporter test passed")
 
 
+def test_directory_output_buffering():
+    """Test that directory output is written once per directory and errors stay in order."""
+    print("Testing directory output buffering...")
+    
+    output_buffer = io.StringIO()
+    error_buffer = io.StringIO()
+    
+    output_mgr = OutputManager(verbose_level=3, output_stream=output_buffer, error_stream=error_buffer)
+    
+    output_mgr.print_entering_directory("/test/dir", is_root=True)
+    output_mgr.print_examining_path("/test/dir/file.txt", False, "ORPHANED_SID", False)
+    
+    # Nothing written until the directory summary
+    assert output_buffer.getvalue() == "", "Directory output should be buffered"
+    
+    # Errors flush pending directory output first
+    output_mgr.print_error("/test/dir/locked.txt", Exception("Access denied"), False)
+    assert "file.txt" in output_buffer.getvalue(), "Buffered output should be written before errors"
+    assert "Access denied" in error_buffer.getvalue()
+    
+    output_mgr.print_directory_summary("/test/dir", is_root=True)
+    output_content = output_buffer.getvalue()
+    assert "Completed /test/dir" in output_content, "Summary should be written"
+    
+    # Explicit flush with nothing pending is harmless
+    output_mgr.flush()
+    assert output_buffer.getvalue() == output_content
+    
+    print("✓ Directory output buffering test passed")
+
+
+def test_directory_output_buffer_limit():
+    """Test that large directories are written in batches of OUTPUT_BUFFER_LINES lines."""
+    print("Testing directory output buffer limit...")
+    
+    from src.output_manager import OUTPUT_BUFFER_LINES
+    
+    output_buffer = io.StringIO()
+    output_mgr = OutputManager(verbose_level=3, output_stream=output_buffer)
+    
+    # The "Entering directory" line plus enough files to fill exactly one batch
+    output_mgr.print_entering_directory("/test/dir")
+    for index in range(OUTPUT_BUFFER_LINES - 1):
+        output_mgr.print_examining_path(f"/test/dir/file{index}.txt", False, "DOMAIN\\User", True)
+    
+    assert output_buffer.getvalue().count("\n") == OUTPUT_BUFFER_LINES, "Full batch should be written"
+    assert output_mgr._buffer == [], "Buffering should continue after a batch is written"
+    
+    output_mgr.print_examining_path("/test/dir/last.txt", False, "DOMAIN\\User", True)
+    assert "last.txt" not in output_buffer.getvalue()
+    
+    output_mgr.print_directory_summary("/test/dir")
+    assert "last.txt" in output_buffer.getvalue()
+    
+    print("✓ Directory output buffer limit test passed")
+
+
+def test_non_printing_levels_specialized():
+    """Test that levels below 2 still count examined paths without printing them."""
+    print("Testing non-printing level specialization...")
+    
+    output_buffer = io.StringIO()
+    output_mgr = OutputManager(verbose_level=1, output_stream=output_buffer)
+    
+    output_mgr.print_examining_path("/test/dir", True, "DOMAIN\\User", True)
+    output_mgr.print_examining_path("/test/dir/file.txt", False, None, False)
+    output_mgr.print_ownership_change("/test/dir/file.txt", is_directory=False, dry_run=True)
+    
+    assert output_mgr.total_dirs_processed == 1
+    assert output_mgr.total_files_processed == 1
+    assert output_mgr.files_needing_change == 1
+    assert output_buffer.getvalue() == "", "Level 1 should not print examined paths"
+    
+    # Level 2 keeps the printing methods
+    verbose_mgr = OutputManager(verbose_level=2, output_stream=io.StringIO())
+    assert verbose_mgr.print_examining_path.__func__ is OutputManager.print_examining_path
+    
+    # Level 0 also skips directory messages, leaving nothing buffered
+    level_0_buffer = io.StringIO()
+    level_0_mgr = OutputManager(verbose_level=0, output_stream=level_0_buffer)
+    level_0_mgr.print_entering_directory("/test/dir", is_root=True)
+    level_0_mgr.print_directory_summary("/test/dir", is_root=True)
+    assert level_0_mgr._buffer is None
+    assert level_0_buffer.getvalue() == "", "Level 0 should not print directory messages"
+    assert output_mgr.print_entering_directory.__func__ is OutputManager.print_entering_directory
+    
+    print("✓ Non-printing level specialization test passed")
+
+
 def main():
     """Run all tests."""
     print("Running OutputManager tests...\n")
@@ -191,6 +280,9 @@ def main():
         test_normal_mode()
         test_stats_reporter()
         test_quiet_stats_reporter()
+        test_directory_output_buffering()
+        test_directory_output_buffer_limit()
+        test_non_printing_levels_specialized()
         
         print("\n✅ All OutputManager tests passed!")
         
@@ -15,6 +15,13 @@ from src.security_manager import SecurityManager
 from src.error_manager import ErrorManager
 
 
+def lookup_error(winerror):
+    """Build an exception shaped like the pywintypes.error raised by LookupAccountSid."""
+    error = Exception(winerror, 'LookupAccountSid', 'Lookup failed')
+    error.winerror = winerror
+    return error
+
+
 class TestSecurityManager(unittest.TestCase):
     """Test cases for SecurityManager class."""
     
@@ -54,8 +61,8 @@ class TestSecurityManager(unittest.TestCase):
         mock_sid = Mock()
         mock_sd.GetSecurityDescriptorOwner.return_value = mock_sid
         mock_win32security.GetFileSecurity.return_value = mock_sd
-        # LookupAccountSid raises exception for invalid SID
-        mock_win32security.LookupAccountSid.side_effect = Exception("Invalid SID")
+        # LookupAccountSid raises ERROR_NONE_MAPPED for invalid SID
+        mock_win32security.LookupAccountSid.side_effect = lookup_error(1332)
         
         # Test getting current owner
         owner_name, owner_sid = self.security_manager.get_current_owner("/test/path")
@@ -76,6 +83,40 @@ class TestSecurityManager(unittest.TestCase):
         
         self.assertIn("Access denied", str(context.exception))
     
+    @patch('src.security_manager.win32security')
+    def test_get_current_owner_deferred_error_report(self, mock_win32security):
+        """Test that report_errors=False leaves ErrorManager reporting to the caller."""
+        access_denied = Exception("Access denied")
+        mock_win32security.GetFileSecurity.side_effect = access_denied
+        
+        with self.assertRaises(Exception) as context:
+            self.security_manager.get_current_owner("/test/path", report_errors=False)
+        
+        self.mock_error_manager.handle_exception.assert_not_called()
+        self.assertIs(context.exception.__cause__, access_denied)
+        
+        # The caller reports the original exception later, from its own thread
+        self.mock_error_manager.handle_exception.return_value = Mock(should_terminate=False)
+        self.security_manager.report_error(access_denied, "/test/path", "Getting current owner")
+        self.mock_error_manager.handle_exception.assert_called_once_with(
+            access_denied, path="/test/path", context="Getting current owner"
+        )
+    
+    @patch('src.security_manager.win32security')
+    def test_get_current_owner_api_path(self, mock_win32security):
+        """Test that api_path goes to the Windows API while messages keep path."""
+        mock_win32security.GetFileSecurity.side_effect = Exception("Access denied")
+        
+        with self.assertRaises(Exception) as context:
+            self.security_manager.get_current_owner(
+                "C:\\Data\\file.txt", api_path="\\\\?\\C:\\Data\\file.txt", report_errors=False
+            )
+        
+        mock_win32security.GetFileSecurity.assert_called_once_with(
+            "\\\\?\\C:\\Data\\file.txt", mock_win32security.OWNER_SECURITY_INFORMATION
+        )
+        self.assertIn("'C:\\Data\\file.txt'", str(context.exception))
+    
     @patch('src.security_manager.win32security')
     def test_is_sid_valid_true(self, mock_win32security):
         """Test SID validation for valid SID."""
@@ -91,12 +132,79 @@ class TestSecurityManager(unittest.TestCase):
     def test_is_sid_valid_false(self, mock_win32security):
         """Test SID validation for invalid SID."""
         mock_sid = Mock()
-        mock_win32security.LookupAccountSid.side_effect = Exception("Invalid SID")
+        mock_win32security.LookupAccountSid.side_effect = lookup_error(1332)
         
         result = self.security_manager.is_sid_valid(mock_sid)
         
         self.assertFalse(result)
     
+    @patch('src.security_manager.win32security')
+    def test_is_sid_valid_cached(self, mock_win32security):
+        """Test that repeated SID validation uses the lookup cache."""
+        mock_sid = Mock()
+        mock_orphan_sid = Mock()
+        
+        def lookup(system, sid):
+            if sid is mock_orphan_sid:
+                raise lookup_error(1332)
+            return ("TestUser", "DOMAIN", 1)
+        mock_win32security.LookupAccountSid.side_effect = lookup
+        
+        for _ in range(3):
+            self.assertTrue(self.security_manager.is_sid_valid(mock_sid))
+            self.assertFalse(self.security_manager.is_sid_valid(mock_orphan_sid))
+        
+        # One lookup per distinct SID, including the orphaned one
+        self.assertEqual(mock_win32security.LookupAccountSid.call_count, 2)
+    
+    @patch('src.security_manager.win32security')
+    def test_lookup_failure_not_cached(self, mock_win32security):
+        """Test that only ERROR_NONE_MAPPED marks a SID orphaned; other failures raise uncached."""
+        mock_sid = Mock()
+        mock_sd = Mock()
+        mock_sd.GetSecurityDescriptorOwner.return_value = mock_sid
+        mock_win32security.GetFileSecurity.return_value = mock_sd
+        
+        # RPC_S_SERVER_UNAVAILABLE: the domain controller could not be reached
+        mock_win32security.LookupAccountSid.side_effect = lookup_error(1722)
+        with self.assertRaises(Exception):
+            self.security_manager.is_sid_valid(mock_sid)
+        with self.assertRaises(Exception):
+            self.security_manager.get_current_owner("/test/path")
+        
+        # The failure was not cached, so the next lookup reaches the API again
+        mock_win32security.LookupAccountSid.side_effect = None
+        mock_win32security.LookupAccountSid.return_value = ("TestUser", "DOMAIN", 1)
+        self.assertTrue(self.security_manager.is_sid_valid(mock_sid))
+        self.assertTrue(self.security_manager.is_sid_valid(mock_sid))
+        self.assertEqual(mock_win32security.LookupAccountSid.call_count, 3)
+    
+    @patch('src.security_manager.win32security')
+    def test_is_sid_valid_concurrent_single_lookup(self, mock_win32security):
+        """Test that concurrent misses on one SID share a single lookup."""
+        import threading
+        import time
+        
+        mock_sid = Mock()
+        
+        def slow_lookup(system, sid):
+            time.sleep(0.05)  # Simulate a domain controller round trip
+            return ("TestUser", "DOMAIN", 1)
+        mock_win32security.LookupAccountSid.side_effect = slow_lookup
+        
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(self.security_manager.is_sid_valid(mock_sid)))
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        self.assertEqual(results, [True] * 4)
+        self.assertEqual(mock_win32security.LookupAccountSid.call_count, 1)
+    
     @patch('src.security_manager.win32security')
     def test_set_owner_success(self, mock_win32security):
         """Test setting ownership successfully."""
@@ -116,6 +224,38 @@ class TestSecurityManager(unittest.TestCase):
             "/test/path", mock_win32security.OWNER_SECURITY_INFORMATION, mock_sd
         )
     
+    @patch('src.security_manager.win32security')
+    def test_set_owner_already_target(self, mock_win32security):
+        """Test that set_owner skips the write when the owner is already the target."""
+        mock_sd = Mock()
+        mock_owner_sid = Mock()
+        mock_sd.GetSecurityDescriptorOwner.return_value = mock_owner_sid
+        mock_win32security.GetFileSecurity.return_value = mock_sd
+        
+        result = self.security_manager.set_owner("/test/path", mock_owner_sid)
+        
+        self.assertTrue(result)
+        mock_sd.SetSecurityDescriptorOwner.assert_not_called()
+        mock_win32security.SetFileSecurity.assert_not_called()
+    
+    @patch('src.security_manager.win32security')
+    def test_set_owner_with_known_owner(self, mock_win32security):
+        """Test that a known current owner skips the descriptor read."""
+        mock_owner_sid = Mock()
+        mock_sd = mock_win32security.SECURITY_DESCRIPTOR.return_value
+        
+        # Already the target owner: no system calls at all
+        self.assertTrue(self.security_manager.set_owner("/test/path", mock_owner_sid, mock_owner_sid))
+        mock_win32security.SetFileSecurity.assert_not_called()
+        
+        # Different owner: write without reading the existing descriptor
+        self.assertTrue(self.security_manager.set_owner("/test/path", mock_owner_sid, Mock()))
+        mock_win32security.GetFileSecurity.assert_not_called()
+        mock_sd.SetSecurityDescriptorOwner.assert_called_once_with(mock_owner_sid, False)
+        mock_win32security.SetFileSecurity.assert_called_once_with(
+            "/test/path", mock_win32security.OWNER_SECURITY_INFORMATION, mock_sd
+        )
+    
     @patch('src.security_manager.win32security')
     def test_set_owner_failure(self, mock_win32security):
         """Test setting ownership failure."""
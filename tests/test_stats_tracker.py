@@ -71,6 +71,25 @@ class TestStatsTracker(unittest.TestCase):
         self.stats.increment_files_changed()
         self.assertEqual(self.stats.files_changed, initial_count + 2)
     
+    def test_increment_subtrees_skipped(self):
+        """Test counting skipped subtrees and reporting them only when there are any."""
+        output_buffer = io.StringIO()
+        original_stdout = sys.stdout
+        sys.stdout = output_buffer
+        try:
+            self.stats.print_report(quiet=False)
+            self.assertNotIn("Clean subtrees skipped", output_buffer.getvalue())
+            
+            self.stats.increment_subtrees_skipped(2)
+            self.stats.increment_subtrees_skipped()
+            self.assertEqual(self.stats.subtrees_skipped, 3)
+            self.assertEqual(self.stats.get_summary_stats()['subtrees_skipped'], 3)
+            
+            self.stats.print_report(quiet=False)
+            self.assertIn("Clean subtrees skipped: 3", output_buffer.getvalue())
+        finally:
+            sys.stdout = original_stdout
+    
     def test_increment_exceptions(self):
         """Test incrementing exceptions counter."""
         initial_count = self.stats.exceptions
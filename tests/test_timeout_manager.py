@@ -257,6 +257,15 @@ class TestTimeoutManager(unittest.TestCase):
         remaining2 = tm2.get_remaining_time()
         self.assertLess(remaining1, remaining2)
     
+    def test_timeout_ignores_wall_clock_changes(self):
+        """Test that wall-clock jumps do not trigger or delay the timeout."""
+        tm = TimeoutManager(60)
+        
+        # Simulate the system clock jumping forward by an hour
+        with patch('time.time', return_value=time.time() + 3600):
+            self.assertFalse(tm.is_timeout_reached())
+            self.assertLess(tm.get_elapsed_time(), 60)
+    
     def test_timeout_edge_cases(self):
         """Test timeout edge cases."""
         # Negative timeout (should behave like no timeout)
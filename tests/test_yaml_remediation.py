@@ -111,6 +111,9 @@ orphaned_sids:
             )
             # safe_exit should be called at least once
             self.assertTrue(mock_exit.called)
+            # The missing file is reported once, as not found
+            self.mock_output.print_general_error.assert_called_once()
+            self.assertIn("not found", self.mock_output.print_general_error.call_args[0][0])
     
     @unittest.skipUnless(YAML_AVAILABLE, "PyYAML not available")
     def test_load_yaml_remediation_invalid_yaml(self):
@@ -137,6 +140,30 @@ orphaned_sids:
             os.chdir(original_cwd)
             os.unlink(yaml_file)
     
+    @unittest.skipUnless(YAML_AVAILABLE, "PyYAML not available")
+    def test_load_yaml_remediation_non_ascii_owner(self):
+        """Test that a UTF-8 file with a non-ASCII account name is decoded correctly."""
+        yaml_content = self.valid_yaml_content.replace("TestUser", "Jürgen")
+        
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False,
+                                         encoding='utf-8') as f:
+            f.write(yaml_content)
+            yaml_file = f.name
+        
+        try:
+            original_cwd = os.getcwd()
+            yaml_dir = os.path.dirname(yaml_file)
+            yaml_filename = os.path.basename(yaml_file)
+            os.chdir(yaml_dir)
+            
+            result = load_yaml_remediation(yaml_filename, self.mock_output)
+            
+            self.assertEqual(result, "Jürgen")
+            
+        finally:
+            os.chdir(original_cwd)
+            os.unlink(yaml_file)
+    
     @unittest.skipUnless(YAML_AVAILABLE, "PyYAML not available")
     def test_load_yaml_remediation_missing_new_owner_account(self):
         """Test YAML file missing new_owner_account."""
@@ -211,40 +238,36 @@ class TestYAMLArgumentParsing(unittest.TestCase):
     def test_yaml_remediation_argument_parsing(self):
         """Test that YAML remediation argument is parsed correctly."""
         with patch('sys.argv', ['fix_owner.py', '/test/path', '--yaml-remediation', 'test.yaml']):
-            with patch('fix_owner.validate_path_exists', return_value=True):
-                with patch('fix_owner.validate_path_is_directory', return_value=True):
-                    args = parse_arguments()
-                    
-                    self.assertEqual(args.yaml_remediation, 'test.yaml')
-                    self.assertEqual(args.root_path, '/test/path')
-                    self.assertIsNone(args.owner_account)
+            with patch('fix_owner.classify_path', return_value='dir'):
+                args = parse_arguments()
+                
+                self.assertEqual(args.yaml_remediation, 'test.yaml')
+                self.assertEqual(args.root_path, '/test/path')
+                self.assertIsNone(args.owner_account)
     
     def test_yaml_remediation_with_owner_account_error(self):
         """Test that specifying both YAML file and owner account raises error."""
         with patch('sys.argv', ['fix_owner.py', '/test/path', 'Administrator', '--yaml-remediation', 'test.yaml']):
-            with patch('fix_owner.validate_path_exists', return_value=True):
-                with patch('fix_owner.validate_path_is_directory', return_value=True):
-                    with self.assertRaises(SystemExit):
-                        parse_arguments()
+            with patch('fix_owner.classify_path', return_value='dir'):
+                with self.assertRaises(SystemExit):
+                    parse_arguments()
     
     def test_yaml_remediation_short_option(self):
         """Test YAML remediation short option (-yr)."""
         with patch('sys.argv', ['fix_owner.py', '/test/path', '-yr', 'remediation.yaml']):
-            with patch('fix_owner.validate_path_exists', return_value=True):
-                with patch('fix_owner.validate_path_is_directory', return_value=True):
-                    args = parse_arguments()
-                    
-                    self.assertEqual(args.yaml_remediation, 'remediation.yaml')
+            with patch('fix_owner.classify_path', return_value='dir'):
+                args = parse_arguments()
+                
+                self.assertEqual(args.yaml_remediation, 'remediation.yaml')
     
     def test_no_yaml_no_owner_allowed(self):
         """Test that neither YAML nor owner account is allowed (uses current user)."""
         with patch('sys.argv', ['fix_owner.py', '/test/path']):
-            with patch('fix_owner.validate_path_exists', return_value=True):
-                with patch('fix_owner.validate_path_is_directory', return_value=True):
-                    args = parse_arguments()
-                    
-                    self.assertIsNone(args.owner_account)
-                    self.assertIsNone(args.yaml_remediation)
+            with patch('fix_owner.classify_path', return_value='dir'):
+                args = parse_arguments()
+                
+                self.assertIsNone(args.owner_account)
+                self.assertIsNone(args.yaml_remediation)
 
 
 class TestYAMLIntegration(unittest.TestCase):
@@ -296,15 +319,14 @@ orphaned_sids:
             
             # Mock sys.argv to include YAML option
             with patch('sys.argv', ['fix_owner.py', '/test/path', '--yaml-remediation', yaml_filename]):
-                with patch('fix_owner.validate_path_exists', return_value=True):
-                    with patch('fix_owner.validate_path_is_directory', return_value=True):
-                        with patch('fix_owner.PYWIN32_AVAILABLE', True):
-                            # This should not raise an exception
-                            fix_owner.main()
-                            
-                            # Verify that the security manager was called with the YAML-specified account
-                            mock_security_instance.resolve_owner_account.assert_called_with("YAMLTestUser")
-                            
+                with patch('fix_owner.classify_path', return_value='dir'):
+                    with patch('fix_owner.PYWIN32_AVAILABLE', True):
+                        # This should not raise an exception
+                        fix_owner.main()
+                        
+                        # Verify that the security manager was called with the YAML-specified account
+                        mock_security_instance.resolve_owner_account.assert_called_with("YAMLTestUser")
+                        
         finally:
             os.chdir(original_cwd)
             os.unlink(yaml_file)